@@ -24,38 +24,23 @@ Key features
 
 import argparse
 import dataclasses
+import functools
+import html as html_lib
 import os
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
-import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, List, Any
-
-import yaml
-from jinja2 import Template
-from unidecode import unidecode
-from rapidfuzz import fuzz
-
-# Optional deps; import lazily when needed
-try:
-    import docx  # python-docx
-except Exception:
-    docx = None
-
-# Professional DOCX generator
-try:
-    from docx_generator import generate_docx_from_manuscript, DOCX_AVAILABLE as PROFESSIONAL_DOCX_AVAILABLE
-except ImportError:
-    PROFESSIONAL_DOCX_AVAILABLE = False
-    def generate_docx_from_manuscript(*args, **kwargs):
-        raise NotImplementedError("Professional DOCX generator not available")
-
-# WeasyPrint for PDF
-from weasyprint import HTML, CSS
+from typing import Dict, Optional, List, Any, Set
+
+from manuscript_reader import can_read_docx, docx_paragraphs, manuscript_cache
+
+# Heavy/optional deps (WeasyPrint, Jinja2, PyYAML, unidecode, python-docx and the
+# professional DOCX generator) are imported where they are used so commands like
+# `covercalc` start quickly.
 
 APP_NAME = "BookForge"
 VERSION = "1.0.0"
@@ -131,9 +116,13 @@ class BuildConfig:
     toc_depth: int = 2
     epub: bool = True
     docx: bool = True
+    pdf_optimize: bool = False  # losslessly recompress embedded images (slower build, smaller PDF)
+    fast_preview: bool = False  # quicker drafts: no recto chapter starts, hyphenation or TOC
 
     def to_yaml(self) -> str:
-        return yaml.safe_dump(dataclasses.asdict(self), sort_keys=False, allow_unicode=True)
+        import yaml
+        _, dumper = _yaml_safe_loader_dumper()
+        return yaml.dump(dataclasses.asdict(self), Dumper=dumper, sort_keys=False, allow_unicode=True)
 
 # ----------------------
 # Utilities
@@ -143,7 +132,9 @@ def inch_to_mm(x: float) -> float:
     return round(x * 25.4, 3)
 
 
+@functools.lru_cache(maxsize=None)
 def which(exe: str) -> Optional[str]:
+    # PATH lookups are cached for the life of the process
     return shutil.which(exe)
 
 
@@ -151,9 +142,62 @@ def have_pandoc() -> bool:
     return which("pandoc") is not None
 
 
+# Input formats by extension. Passing --from explicitly keeps pandoc from
+# probing the file; unknown extensions are read as markdown like plain text.
+PANDOC_INPUT_FORMATS = {
+    ".docx": "docx",
+    ".md": "markdown",
+    ".txt": "markdown",
+    ".html": "html",
+    ".htm": "html",
+    ".odt": "odt",
+    ".rtf": "rtf",
+    ".epub": "epub",
+}
+
+
+def run_pandoc(src: Path, to: str, *extra: str, output: Optional[Path] = None,
+               timeout: Optional[float] = None) -> str:
+    """Run one pandoc conversion. Returns stdout unless `output` is given."""
+    from_format = PANDOC_INPUT_FORMATS.get(Path(src).suffix.lower(), "markdown")
+    # Use the resolved path so exec does not search PATH again
+    cmd = [which("pandoc") or "pandoc", str(src), "--from", from_format, "--to", to, *extra]
+    if output is not None:
+        subprocess.run(cmd + ["-o", str(output)], check=True, timeout=timeout)
+        return ""
+    return subprocess.check_output(cmd, encoding="utf-8", timeout=timeout)
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_safe_loader_dumper():
+    """PyYAML's safe Loader/Dumper, the libyaml-backed ones when available."""
+    import yaml
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:  # PyYAML built without libyaml
+        return yaml.SafeLoader, yaml.SafeDumper
+
+
+@functools.lru_cache(maxsize=1)
+def _professional_docx():
+    """docx_generator.generate_docx_from_manuscript, or None if it is unavailable."""
+    try:
+        from docx_generator import generate_docx_from_manuscript, DOCX_AVAILABLE
+    except ImportError:
+        return None
+    return generate_docx_from_manuscript if DOCX_AVAILABLE else None
+
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@functools.lru_cache(maxsize=4096)
 def slugify(s: str) -> str:
-    s = unidecode(s)
-    s = re.sub(r"[^A-Za-z0-9]+", "-", s)
+    # unidecode is a no-op on ASCII, which most headings are
+    if not s.isascii():
+        from unidecode import unidecode
+        s = unidecode(s)
+    s = _SLUG_RE.sub("-", s)
     return s.strip("-").lower()
 
 
@@ -290,30 +334,57 @@ def guess_pages_from_wordcount(path: Path, font_size_pt: float) -> Optional[int]
         return None
 
 
+def _stream_wordcount(path: Path, chunk_size: int = 1 << 20) -> int:
+    # Plain text: split raw bytes in chunks, never decoding or holding the whole file.
+    # Only ASCII whitespace separates words here, which is fine for an estimate.
+    count = 0
+    carry = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            words = (carry + chunk).split()
+            # A chunk ending mid-word: hold the fragment back for the next chunk
+            carry = words.pop() if words and not chunk[-1:].isspace() else b""
+            count += len(words)
+    return count + (1 if carry else 0)
+
+
 def estimate_wordcount(path: Path) -> Optional[int]:
+    # Whitespace-delimited tokens, counted without building a list of words
     try:
-        txt = extract_text_quick(path)
-        words = re.findall(r"\b\w+\b", txt)
-        return len(words)
+        cache = manuscript_cache(path)
+        if cache.wordcount is None:
+            ext = path.suffix.lower()
+            if cache.raw_text is None and ext in (".txt", ".md"):
+                cache.wordcount = _stream_wordcount(path)
+            elif ext == ".docx" and can_read_docx():
+                # Count per paragraph rather than joining the book into one string
+                cache.wordcount = sum(len(p.split()) for p in docx_paragraphs(path))
+            else:
+                cache.wordcount = len(extract_text_quick(path).split())
+        return cache.wordcount
     except Exception:
         return None
 
 
 def extract_text_quick(path: Path) -> str:
+    cache = manuscript_cache(path)
+    if cache.raw_text is None:
+        cache.raw_text = _extract_text(path)
+    return cache.raw_text
+
+
+def _extract_text(path: Path) -> str:
     ext = path.suffix.lower()
     if ext == ".txt":
         return Path(path).read_text(encoding="utf-8", errors="ignore")
     if ext == ".md":
         return Path(path).read_text(encoding="utf-8", errors="ignore")
-    if ext == ".docx" and docx is not None:
-        d = docx.Document(str(path))
-        return "\n".join(p.text for p in d.paragraphs)
-    # Fallback: try Pandoc
+    if ext == ".docx" and can_read_docx():
+        return "\n".join(docx_paragraphs(path))
+    # Fallback: Pandoc. Take the text from the HTML conversion, which is cached
+    # for the build, instead of paying for a separate `pandoc -t plain` run.
     if have_pandoc():
-        with tempfile.TemporaryDirectory() as td:
-            out = Path(td) / "tmp.txt"
-            subprocess.run(["pandoc", str(path), "-t", "plain", "-o", str(out)], check=True)
-            return out.read_text(encoding="utf-8")
+        return html_lib.unescape(_HTML_TAG_RE.sub(" ", convert_to_html(path)))
     raise RuntimeError("Cannot extract text; install python-docx for .docx or Pandoc for other types.")
 
 
@@ -321,70 +392,63 @@ def extract_text_quick(path: Path) -> str:
 # Build pipeline
 # ----------------------
 
+# Front matter section titles, matched against the stripped, upper-cased line
+_FRONT_MATTER_RE = re.compile(
+    r'^(?:DEDICATION$'
+    r'|ACKNOWLEDGE?MENTS?$'
+    r'|PREFACE$'
+    r'|FOREWORD$'
+    r'|INTRODUCTION$'
+    r'|ABOUT THE AUTHOR$'
+    r'|ALSO BY'
+    r'|COPYRIGHT'
+    r'|TABLE OF CONTENTS$'
+    r'|CONTENTS$)'
+)
+
+# Common chapter patterns, matched against the stripped, upper-cased line
+_CHAPTER_HEADING_RE = re.compile(
+    r'^(?:CHAPTER\s+(?:[A-Z]+[\w\s\-]*|\d+)(?::|$)'  # "CHAPTER ONE: Title", "CHAPTER 1", ...
+    r'|PART\s+(?:[IVX]+|\d+)'  # "PART I", "PART 2"
+    r'|PROLOGUE'
+    r'|EPILOGUE'
+    r'|INTERLUDE)'
+)
+
+
 def detect_front_matter(line: str) -> bool:
     """Detect if a line is front matter (dedication, acknowledgments, etc.)"""
     line_stripped = line.strip()
     if not line_stripped or len(line_stripped) > 100:
         return False
+    return _FRONT_MATTER_RE.match(line_stripped.upper()) is not None
+
+# Characters whose upper case starts CHAPTER/PART/PROLOGUE/EPILOGUE/INTERLUDE
+# (dotless 'ı' upper-cases to 'I')
+_CHAPTER_FIRST_CHARS = frozenset("CcPpEeIiı")
 
-    line_upper = line_stripped.upper()
-
-    # Front matter patterns
-    front_matter_keywords = [
-        r'^DEDICATION$',
-        r'^ACKNOWLEDGMENTS?$',
-        r'^ACKNOWLEDGEMENTS?$',
-        r'^PREFACE$',
-        r'^FOREWORD$',
-        r'^INTRODUCTION$',
-        r'^ABOUT THE AUTHOR$',
-        r'^ALSO BY',
-        r'^COPYRIGHT',
-        r'^TABLE OF CONTENTS$',
-        r'^CONTENTS$',
-    ]
-
-    for pattern in front_matter_keywords:
-        if re.match(pattern, line_upper):
-            return True
-
-    return False
 
 def detect_chapter_heading(line: str) -> bool:
     """Detect if a line is a chapter heading"""
     line_stripped = line.strip()
     if not line_stripped or len(line_stripped) > 200:  # Headings should be short
         return False
-
-    line_upper = line_stripped.upper()
-
-    # Common chapter patterns (more comprehensive)
-    patterns = [
-        r'^CHAPTER\s+[A-Z]+[\w\s\-]*:',  # "CHAPTER ONE: Title"
-        r'^CHAPTER\s+\d+:',  # "CHAPTER 1: Title"
-        r'^CHAPTER\s+[A-Z]+[\w\s\-]*$',  # "CHAPTER ONE"
-        r'^CHAPTER\s+\d+$',  # "CHAPTER 1"
-        r'^PART\s+[IVX]+',  # "PART I", "PART II"
-        r'^PART\s+\d+',  # "PART 1", "PART 2"
-        r'^PROLOGUE',
-        r'^EPILOGUE',
-        r'^INTERLUDE',
-    ]
-
-    for pattern in patterns:
-        if re.match(pattern, line_upper):
-            return True
-
-    return False
+    # Most lines are prose; reject them on the first letter before upper-casing
+    if line_stripped[0] not in _CHAPTER_FIRST_CHARS:
+        return False
+    return _CHAPTER_HEADING_RE.match(line_stripped.upper()) is not None
 
 def txt_to_html_with_chapters(text: str) -> str:
     """Convert plain text to HTML with chapter detection and proper structure"""
+    return '<html><body>\n' + _txt_body(text) + '\n</body></html>'
+
+
+def _txt_body(text: str) -> str:
     lines = text.split('\n')
-    html_lines = ['<html><body>']
-    in_paragraph = False
+    html_lines = []
+    in_section = False
     chapter_count = 0
     section_count = 0
-    skip_next = False
     blank_line_count = 0
 
     # Detect if the first non-empty line is a title (for cover page)
@@ -402,19 +466,21 @@ def txt_to_html_with_chapters(text: str) -> str:
         elif title_line:
             break
 
-    for i, line in enumerate(lines):
-        if skip_next:
-            skip_next = False
-            continue
+    # Lines of the paragraph being built; emitted as one <p> when it ends
+    para: List[str] = []
 
+    def flush_paragraph():
+        if para:
+            html_lines.append('<p>' + ' '.join(para) + '</p>')
+            para.clear()
+
+    for line in lines:
         stripped = line.strip()
 
         # Count consecutive blank lines (for section breaks)
         if not stripped:
             blank_line_count += 1
-            if in_paragraph:
-                html_lines.append('</p>')
-                in_paragraph = False
+            flush_paragraph()
             # 3+ blank lines = section break ornament
             if blank_line_count >= 3 and chapter_count > 0:
                 html_lines.append('<div class="hr-ornament"></div>')
@@ -425,14 +491,13 @@ def txt_to_html_with_chapters(text: str) -> str:
 
         # Detect front matter (Dedication, Acknowledgments, etc.)
         if detect_front_matter(line):
-            # Close any open sections
-            if chapter_count > 0:
+            flush_paragraph()
+            # Close any open section
+            if in_section:
                 html_lines.append('</section>')
-            if in_paragraph:
-                html_lines.append('</p>')
-                in_paragraph = False
 
             section_count += 1
+            in_section = True
             heading_id = f"front-matter-{section_count}"
             html_lines.append(f'<section class="front-matter-section" id="{heading_id}">')
             html_lines.append(f'<h2 class="section-title">{html_escape(stripped)}</h2>')
@@ -440,87 +505,87 @@ def txt_to_html_with_chapters(text: str) -> str:
 
         # Detect chapter headings
         if detect_chapter_heading(line):
+            flush_paragraph()
             # Close previous section if open
-            if chapter_count > 0 or section_count > 0:
+            if in_section:
                 html_lines.append('</section>')
 
-            # Close previous paragraph if open
-            if in_paragraph:
-                html_lines.append('</p>')
-                in_paragraph = False
-
             # Add chapter heading with proper structure
             chapter_count += 1
+            in_section = True
             heading_id = f"chapter-{chapter_count}"
             html_lines.append(f'<section class="chapter" id="{heading_id}">')
             html_lines.append(f'<h1 class="chapter-title">{html_escape(stripped)}</h1>')
-            in_paragraph = False
             continue
 
         # Regular text - add to paragraph
-        escaped = html_escape(stripped)
-
-        # Start new paragraph if needed
-        if not in_paragraph:
-            html_lines.append('<p>')
-            in_paragraph = True
-        else:
-            # Add space between lines in same paragraph
-            html_lines.append(' ')
-
-        html_lines.append(escaped)
+        para.append(html_escape(stripped))
 
     # Close any open tags
-    if in_paragraph:
-        html_lines.append('</p>')
-
-    # Close any open chapter/section
-    if chapter_count > 0 or section_count > 0:
+    flush_paragraph()
+    if in_section:
         html_lines.append('</section>')
 
-    html_lines.append('</body></html>')
     return '\n'.join(html_lines)
 
+_BODY_OPEN_RE = re.compile(r'<body[^>]*>', re.IGNORECASE)
+_BODY_CLOSE_RE = re.compile(r'</body>', re.IGNORECASE)
+
+
+def _body_span(html: str) -> Optional[tuple]:
+    """(start, end) of the text between <body ...> and </body>, or None."""
+    # Two literal searches instead of a lazy (.*?) over the whole document
+    body_open = _BODY_OPEN_RE.search(html)
+    if body_open is None:
+        return None
+    body_close = _BODY_CLOSE_RE.search(html, body_open.end())
+    if body_close is None:
+        return None
+    return body_open.end(), body_close.start()
+
+
+_P_ELEMENT_RE = re.compile(r'<p[^>]*>(.*?)</p>')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 def detect_and_convert_chapters_in_html(html: str) -> str:
     """Post-process HTML to ensure chapters are properly structured for EPUB"""
     try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        from lxml import html as lxml_html
+        from lxml import etree
+    except ImportError:
+        lxml_html = None
+
+    if lxml_html is not None:
+        # One C-level parse; chapter-like paragraphs are swapped for sections in place
+        root = lxml_html.document_fromstring(html)
         chapter_count = 0
-        
-        # Find all paragraphs
-        paragraphs = soup.find_all('p')
-        
-        for p in paragraphs:
-            text_content = p.get_text(strip=True)
-            
+
+        for p in list(root.iter('p')):
+            text_content = p.text_content().strip()
+
             # Check if this paragraph looks like a chapter heading
             if detect_chapter_heading(text_content):
-                # Create a new section and h1 heading
                 chapter_count += 1
                 heading_id = f"chapter-{chapter_count}"
-                
-                # Create section wrapper
-                section = soup.new_tag('section', class_='chapter', id=heading_id)
-                
-                # Create h1 heading
-                h1 = soup.new_tag('h1', class_='chapter-title')
-                h1.string = text_content
-                
-                # Replace paragraph with section containing h1
-                section.append(h1)
-                p.replace_with(section)
-        
-        return str(soup)
-        
-    except ImportError:
-        # Fallback to regex-based approach if BeautifulSoup not available
+
+                # Section wrapper with the heading as an h1
+                section = etree.Element('section', {'class': 'chapter', 'id': heading_id})
+                h1 = etree.SubElement(section, 'h1', {'class': 'chapter-title'})
+                h1.text = text_content
+                section.tail = p.tail
+                p.getparent().replace(p, section)
+
+        return lxml_html.tostring(root.getroottree(), encoding='unicode')
+
+    else:
+        # Fallback to regex-based approach if lxml is not available
         # Extract body content
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL)
-        if not body_match:
+        span = _body_span(html)
+        if span is None:
             return html
         
-        body_content = body_match.group(1)
+        body_content = html[span[0]:span[1]]
         lines = body_content.split('\n')
         processed_lines = []
         chapter_count = 0
@@ -530,18 +595,17 @@ def detect_and_convert_chapters_in_html(html: str) -> str:
             
             # Check if this line looks like a chapter heading in HTML
             # Look for lines that are standalone (not in paragraphs) and match chapter patterns
-            if re.search(r'<p[^>]*>(.*?)</p>', line):
-                # Extract text from paragraph
-                text_match = re.search(r'<p[^>]*>(.*?)</p>', line)
-                if text_match:
-                    text_content = re.sub(r'<[^>]+>', '', text_match.group(1)).strip()
-                    if detect_chapter_heading(text_content) and len(text_content) < 200:
-                        # Convert paragraph to h1 heading and wrap in section
-                        chapter_count += 1
-                        heading_id = f"chapter-{chapter_count}"
-                        processed_lines.append(f'<section class="chapter" id="{heading_id}">')
-                        processed_lines.append(f'<h1 class="chapter-title">{text_match.group(1)}</h1>')
-                        continue
+            # Extract text from paragraph
+            text_match = _P_ELEMENT_RE.search(line)
+            if text_match:
+                text_content = _HTML_TAG_RE.sub('', text_match.group(1)).strip()
+                if detect_chapter_heading(text_content) and len(text_content) < 200:
+                    # Convert paragraph to h1 heading and wrap in section
+                    chapter_count += 1
+                    heading_id = f"chapter-{chapter_count}"
+                    processed_lines.append(f'<section class="chapter" id="{heading_id}">')
+                    processed_lines.append(f'<h1 class="chapter-title">{text_match.group(1)}</h1>')
+                    continue
             
             # Check for plain text lines that might be headings (from pre tags)
             if stripped and not stripped.startswith('<') and detect_chapter_heading(stripped) and len(stripped) < 200:
@@ -559,40 +623,34 @@ def detect_and_convert_chapters_in_html(html: str) -> str:
         
         # Reconstruct HTML
         new_body = '\n'.join(processed_lines)
-        html = html[:body_match.start(1)] + new_body + html[body_match.end(1):]
+        html = html[:span[0]] + new_body + html[span[1]:]
         
         return html
 
+
+
 def extract_body_content(html: str) -> str:
     """Extract just the body content from a full HTML document"""
     # Try to extract content between <body> tags
-    body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL | re.IGNORECASE)
-    if body_match:
-        return body_match.group(1).strip()
+    span = _body_span(html)
+    if span is not None:
+        return html[span[0]:span[1]].strip()
     # If no body tags, assume it's already just body content
     return html.strip()
 
 def convert_to_html(manuscript: Path) -> str:
+    cache = manuscript_cache(manuscript)
+    if cache.body_html is None:
+        cache.body_html = _convert_to_html(manuscript)
+    return cache.body_html
+
+
+def _convert_to_html(manuscript: Path) -> str:
     ext = manuscript.suffix.lower()
     if have_pandoc():
         try:
-            # Determine input format
-            if ext == ".docx":
-                from_format = "docx"
-            elif ext == ".md":
-                from_format = "markdown"
-            else:
-                # For .txt files, use markdown format (Pandoc doesn't support "plain")
-                from_format = "markdown"
-
-            cmd = [
-                "pandoc", str(manuscript),
-                "--from", from_format,
-                "--to", "html5",
-                "--section-divs",
-                "--standalone",
-            ]
-            html = subprocess.check_output(cmd, text=True, timeout=60)
+            # .txt is read as markdown (Pandoc has no "plain" reader)
+            html = run_pandoc(manuscript, "html5", "--section-divs", "--standalone", timeout=60)
             # Post-process to ensure chapter headings are properly detected for txt files
             if ext == ".txt":
                 html = detect_and_convert_chapters_in_html(html)
@@ -603,19 +661,16 @@ def convert_to_html(manuscript: Path) -> str:
             print(f"Pandoc failed ({e}), using fallback converter for {ext}")
             pass  # Fall through to fallback converters below
     # Fallback simple converters
-    if ext == ".md":
-        html = markdown_to_html_simple(Path(manuscript).read_text(encoding="utf-8"))
-        return extract_body_content(html)
-    if ext == ".txt":
-        html = txt_to_html_with_chapters(Path(manuscript).read_text(encoding="utf-8", errors="ignore"))
-        return extract_body_content(html)
-    if ext == ".docx" and docx is not None:
-        html = docx_to_html_simple(manuscript)
-        return extract_body_content(html)
+    converter = SIMPLE_CONVERTERS.get(ext)
+    if converter is not None and (ext != ".docx" or can_read_docx()):
+        return converter(manuscript)
     raise RuntimeError("No conversion path to HTML; install Pandoc or use .md/.txt/.docx with python-docx.")
 
 
 def html_escape(s: str) -> str:
+    # Chained str.replace is deliberate: each call is a C-level scan that returns the
+    # input untouched when there is nothing to escape. str.translate with multi-char
+    # replacements measured ~10x slower, and html.escape emits &#x27; instead of &#39;.
     return (s
             .replace("&", "&amp;")
             .replace("<", "&lt;")
@@ -625,50 +680,68 @@ def html_escape(s: str) -> str:
     )
 
 
+_MD_HEADING_RE = re.compile(r"^(#{1,6}) +(.*)$")
+
+
 def markdown_to_html_simple(md: str) -> str:
+    return "<html><body>\n" + _markdown_body(md) + "\n</body></html>"
+
+
+def _markdown_body(md: str) -> str:
     # Minimalist markdown (not as robust as Pandoc)
-    md = md.replace("\r\n", "\n")
-    lines = md.split("\n")
-    html_lines = ["<html><body>"]
-    in_p = False
-    for line in lines:
-        if re.match(r"^# +", line):
-            level = len(line) - len(line.lstrip('#'))
-            html_lines.append(f"<h{level}>{html_escape(line[level:].strip())}</h{level}>")
-            in_p = False
-        elif not line.strip():
-            if in_p:
-                html_lines.append("</p>")
-                in_p = False
+    html_lines = []
+    para: List[str] = []
+    for line in md.splitlines():
+        heading = _MD_HEADING_RE.match(line)
+        if heading or not line.strip():
+            if para:
+                html_lines.append("<p>" + " ".join(para) + "</p>")
+                para.clear()
+            if heading:
+                level = len(heading.group(1))
+                html_lines.append(f"<h{level}>{html_escape(heading.group(2).strip())}</h{level}>")
         else:
-            if not in_p:
-                html_lines.append("<p>")
-                in_p = True
-            html_lines.append(html_escape(line) + " ")
-    if in_p:
-        html_lines.append("</p>")
-    html_lines.append("</body></html>")
+            para.append(html_escape(line.strip()))
+    if para:
+        html_lines.append("<p>" + " ".join(para) + "</p>")
     return "\n".join(html_lines)
 
 
 def docx_to_html_simple(path: Path) -> str:
-    d = docx.Document(str(path))
-    parts = ["<html><body>"]
-    for p in d.paragraphs:
-        txt = html_escape(p.text)
-        if not txt.strip():
-            parts.append("<br>")
-        else:
-            parts.append(f"<p>{txt}</p>")
-    parts.append("</body></html>")
-    return "".join(parts)
+    return "<html><body>" + _docx_body(path) + "</body></html>"
+
+
+def _docx_body(path: Path) -> str:
+    # Escaping never changes whether a paragraph is blank, so test the raw text
+    # and only escape paragraphs that are kept
+    return "".join(
+        f"<p>{html_escape(text)}</p>" if text.strip() else "<br>"
+        for text in docx_paragraphs(path)
+    )
+
+
+def _md_file_body(path: Path) -> str:
+    return _markdown_body(extract_text_quick(path))
+
+
+def _txt_file_body(path: Path) -> str:
+    return _txt_body(extract_text_quick(path))
+
+
+# Converters used when Pandoc is missing or fails, by manuscript extension.
+# Each returns body HTML directly, so there is no document wrapper to strip.
+SIMPLE_CONVERTERS = {
+    ".md": _md_file_body,
+    ".txt": _txt_file_body,
+    ".docx": _docx_body,
+}
 
 
 # ----------------------
 # Templates
 # ----------------------
 
-HTML_TEMPLATE = Template(r"""
+HTML_TEMPLATE = r"""
 <!doctype html>
 <html lang="{{ language }}">
 <head>
@@ -858,7 +931,16 @@ HTML_TEMPLATE = Template(r"""
       text-indent: 0;
     }
     
-    /* Responsive design */
+    /* Print styles (the print CSS itself is in the block below) */
+    @media print {
+      body.book {
+        max-width: none;
+        padding: 0;
+      }
+    }
+  </style>
+  <style media="screen">
+    /* Responsive design (screen only; WeasyPrint skips this block unparsed) */
     @media (max-width: 768px) {
       body.book {
         font-size: {{ font_size_pt * 1.2 }}px;
@@ -873,16 +955,6 @@ HTML_TEMPLATE = Template(r"""
         font-size: 1.5em;
       }
     }
-    
-    /* Print styles */
-    @media print {
-      {{ base_css }}
-      
-      body.book {
-        max-width: none;
-        padding: 0;
-      }
-    }
   </style>
   <style>
     /* PDF-specific styles (only applied via WeasyPrint) */
@@ -943,10 +1015,10 @@ HTML_TEMPLATE = Template(r"""
   </section>
 </body>
 </html>
-""")
+"""
 
 
-CSS_BASE_TEMPLATE = Template(r"""
+CSS_BASE_TEMPLATE = r"""
 @page {
   size: {{ page_width_mm }}mm {{ page_height_mm }}mm;
   margin-top: {{ top_margin_mm }}mm;
@@ -993,8 +1065,10 @@ p + p { text-indent: 1.2em; margin-top: 0; }
 .hr-ornament { text-align: center; margin: 1.2em 0; }
 .hr-ornament::after { content: "{{ scene_break }}"; letter-spacing: 0.35em; }
 
-.title-page { display: flex; flex-direction: column; align-items: center; justify-content: center; height: 100vh; }
-.half-title { display: flex; align-items: center; justify-content: center; height: 100vh; font-size: 150%; }
+/* Block layout rather than full-height flex boxes: flex is slow to lay out in
+   WeasyPrint, and an explicit page break keeps each of these on its own page */
+.title-page { display: block; text-align: center; padding-top: 30vh; break-after: page; }
+.half-title { display: block; text-align: center; padding-top: 40vh; break-after: page; font-size: 150%; }
 .book-title { font-size: 220%; margin: 0; }
 .book-subtitle { font-size: 140%; margin-top: 0.25em; color: #555; }
 .book-author { margin-top: 1em; font-size: 120%; }
@@ -1018,14 +1092,47 @@ body { counter-reset: page 1; }
 .front-matter .recto, .front-matter .verso { @page { @top-left { content: none } @top-right { content: none } } }
 
 /* Simple TOC autogen (best-effort via JS inserted later) */
-""")
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _jinja_env():
+    # One shared environment for the built-in templates. Autoescape stays off:
+    # body_html is already escaped HTML and the CSS template must not be escaped.
+    from jinja2 import Environment
+    return Environment(autoescape=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template(source: str):
+    # Jinja2 is only needed when building; each template is compiled once on first use
+    return _jinja_env().from_string(source)
 
 
 # ----------------------
 # Build functions
 # ----------------------
 
-def build_outputs(cfg: BuildConfig, manuscript: Path, outdir: Path) -> Dict[str, Path]:
+OUTPUT_FORMATS = ("html", "pdf", "epub", "docx")
+
+
+def parse_outputs(value: str) -> Set[str]:
+    """Parse a comma-separated --only value such as "html,pdf"."""
+    outputs = {v.strip().lower() for v in value.split(",") if v.strip()}
+    unknown = outputs - set(OUTPUT_FORMATS)
+    if unknown or not outputs:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated list of {', '.join(OUTPUT_FORMATS)}; got {value!r}")
+    return outputs
+
+
+def build_outputs(cfg: BuildConfig, manuscript: Path, outdir: Path,
+                  only: Optional[Set[str]] = None) -> Dict[str, Path]:
+    # `only` limits which of pdf/epub/docx are built; the HTML is always written
+    # since the other outputs are made from it
+    wanted = set(OUTPUT_FORMATS) if only is None else only
+    if cfg.fast_preview:
+        cfg = dataclasses.replace(cfg, chapter_starts_right=False, hyphenate=False, include_toc=False)
     outdir.mkdir(parents=True, exist_ok=True)
     print("Converting manuscript to HTML...")
     body_html = convert_to_html(manuscript)
@@ -1033,80 +1140,40 @@ def build_outputs(cfg: BuildConfig, manuscript: Path, outdir: Path) -> Dict[str,
     # Normalize headings to form chapters; add class hooks
     body_html = postprocess_body_html(body_html, cfg)
 
-    # Render full HTML
-    html_final = render_full_html(cfg, body_html)
+    # Render full HTML straight to disk; every later step reads the file
     html_path = outdir / f"{slugify(cfg.title)}.html"
-    html_path.write_text(html_final, encoding="utf-8")
-
-    # PDF via WeasyPrint
-    print("Rendering PDF...")
-    pdf_path = outdir / f"{slugify(cfg.title)}.pdf"
-    base_css = render_base_css(cfg)
-    HTML(string=html_final).write_pdf(target=str(pdf_path), stylesheets=[CSS(string=base_css)])
-
-    outputs = {"html": html_path, "pdf": pdf_path}
-
-    # EPUB via pandoc (optional)
-    if cfg.epub and have_pandoc():
-        print("Building EPUB via Pandoc...")
-        epub_path = outdir / f"{slugify(cfg.title)}.epub"
-        # Use --epub-chapter-level to split chapters on h1 headings
-        # --section-divs preserves the section structure
-        # --toc-depth=2 for better table of contents
-        subprocess.run([
-            "pandoc", str(html_path), "-o", str(epub_path),
-            "--from", "html",
-            "--to", "epub3",
-            "--epub-chapter-level=1",  # Split on h1 headings (chapter titles)
-            "--section-divs",  # Preserve section divisions
-            "--toc-depth=2",  # Include h1 and h2 in TOC
-            "--metadata", f"title={cfg.title}",
-            "--metadata", f"author={cfg.author}",
-            "--metadata", "language=en",
-        ], check=True)
-        outputs["epub"] = epub_path
-
-    # DOCX via professional generator (preferred) or pandoc (fallback)
-    if cfg.docx:
-        docx_path = outdir / f"{slugify(cfg.title)}.docx"
-        if PROFESSIONAL_DOCX_AVAILABLE:
-            print("Building DOCX with professional formatting...")
-            try:
-                # Build config dict for DOCX generator
-                docx_config = {
-                    'title': cfg.title,
-                    'subtitle': cfg.subtitle,
-                    'author': cfg.author,
-                    'trim': cfg.trim,
-                    'top_margin_in': cfg.top_margin_in,
-                    'bottom_margin_in': cfg.bottom_margin_in,
-                    'outer_margin_in': cfg.outer_margin_in,
-                    'gutter_in': cfg.gutter_in,
-                    'font_family': cfg.font_family,
-                    'font_size_pt': cfg.font_size_pt,
-                    'line_height': cfg.line_height,
-                    'include_copyright': cfg.include_copyright,
-                    'copyright_year': cfg.copyright_year,
-                    'copyright_holder': cfg.copyright_holder,
-                    'include_dedication': cfg.include_dedication,
-                    'dedication_text': cfg.dedication_text,
-                    'include_about_author': cfg.include_about_author,
-                    'about_author_text': cfg.about_author_text,
-                    'scene_break': cfg.scene_break,
-                }
-                generate_docx_from_manuscript(manuscript, docx_path, docx_config)
-                outputs["docx"] = docx_path
-            except Exception as e:
-                print(f"Professional DOCX generation failed: {e}")
-                # Fall back to Pandoc
-                if have_pandoc():
-                    print("Falling back to Pandoc for DOCX...")
-                    subprocess.run(["pandoc", str(html_path), "-o", str(docx_path)], check=True)
-                    outputs["docx"] = docx_path
-        elif have_pandoc():
-            print("Building DOCX via Pandoc...")
-            subprocess.run(["pandoc", str(html_path), "-o", str(docx_path)], check=True)
-            outputs["docx"] = docx_path
+    write_full_html(cfg, body_html, html_path)
+    # Don't keep a copy of the book in memory while WeasyPrint lays it out
+    del body_html
+
+    # PDF, EPUB and DOCX only depend on the HTML/manuscript on disk, so they are
+    # started together. Only the pandoc steps run out of process; WeasyPrint and
+    # python-docx are mostly GIL-bound and gain little from sharing the pool.
+    # Each step logs into its own list, printed in a fixed order afterwards.
+    slug = slugify(cfg.title)
+    logs: Dict[str, List[str]] = {}
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = {}
+        if "pdf" in wanted:
+            logs["pdf"] = []
+            futures["pdf"] = pool.submit(_build_pdf, cfg, html_path, outdir / f"{slug}.pdf", logs["pdf"])
+        # EPUB via pandoc (optional)
+        if cfg.epub and "epub" in wanted and have_pandoc():
+            logs["epub"] = []
+            futures["epub"] = pool.submit(_build_epub, cfg, html_path, outdir / f"{slug}.epub", logs["epub"])
+        # DOCX via professional generator (preferred) or pandoc (fallback)
+        if cfg.docx and "docx" in wanted:
+            logs["docx"] = []
+            futures["docx"] = pool.submit(_build_docx, cfg, manuscript, html_path,
+                                          outdir / f"{slug}.docx", logs["docx"])
+
+    outputs = {"html": html_path}
+    for k, fut in futures.items():
+        for line in logs[k]:
+            print(line)
+        path = fut.result()
+        if path is not None:
+            outputs[k] = path
 
     print("Done. Outputs:")
     for k, p in outputs.items():
@@ -1114,71 +1181,217 @@ def build_outputs(cfg: BuildConfig, manuscript: Path, outdir: Path) -> Dict[str,
     return outputs
 
 
+def _build_pdf(cfg: BuildConfig, html_path: Path, pdf_path: Path, log: List[str]) -> Path:
+    # PDF via WeasyPrint. The print CSS is already inlined in the HTML as an
+    # author stylesheet; passing it again via stylesheets= only adds a user-origin
+    # copy that the author rules override everywhere, so it is not repeated.
+    from weasyprint import HTML
+    log.append("Rendering PDF...")
+    HTML(filename=str(html_path)).write_pdf(target=str(pdf_path), optimize_images=cfg.pdf_optimize)
+    return pdf_path
+
+
+def _build_epub(cfg: BuildConfig, html_path: Path, epub_path: Path, log: List[str]) -> Path:
+    log.append("Building EPUB via Pandoc...")
+    # Use --epub-chapter-level to split chapters on h1 headings
+    # --section-divs preserves the section structure
+    # --toc-depth=2 for better table of contents
+    run_pandoc(
+        html_path, "epub3",
+        "--epub-chapter-level=1",  # Split on h1 headings (chapter titles)
+        "--section-divs",  # Preserve section divisions
+        "--toc-depth=2",  # Include h1 and h2 in TOC
+        "--metadata", f"title={cfg.title}",
+        "--metadata", f"author={cfg.author}",
+        "--metadata", "language=en",
+        output=epub_path,
+    )
+    return epub_path
+
+
+def _build_docx(cfg: BuildConfig, manuscript: Path, html_path: Path, docx_path: Path,
+                log: List[str]) -> Optional[Path]:
+    generate_docx = _professional_docx()
+    if generate_docx is not None:
+        log.append("Building DOCX with professional formatting...")
+        try:
+            # Build config dict for DOCX generator
+            docx_config = {
+                'title': cfg.title,
+                'subtitle': cfg.subtitle,
+                'author': cfg.author,
+                'trim': cfg.trim,
+                'top_margin_in': cfg.top_margin_in,
+                'bottom_margin_in': cfg.bottom_margin_in,
+                'outer_margin_in': cfg.outer_margin_in,
+                'gutter_in': cfg.gutter_in,
+                'font_family': cfg.font_family,
+                'font_size_pt': cfg.font_size_pt,
+                'line_height': cfg.line_height,
+                'include_copyright': cfg.include_copyright,
+                'copyright_year': cfg.copyright_year,
+                'copyright_holder': cfg.copyright_holder,
+                'include_dedication': cfg.include_dedication,
+                'dedication_text': cfg.dedication_text,
+                'include_about_author': cfg.include_about_author,
+                'about_author_text': cfg.about_author_text,
+                'scene_break': cfg.scene_break,
+            }
+            generate_docx(manuscript, docx_path, docx_config)
+            return docx_path
+        except Exception as e:
+            log.append(f"Professional DOCX generation failed: {e}")
+            # Fall back to Pandoc
+            if have_pandoc():
+                log.append("Falling back to Pandoc for DOCX...")
+                run_pandoc(html_path, "docx", output=docx_path)
+                return docx_path
+    elif have_pandoc():
+        log.append("Building DOCX via Pandoc...")
+        run_pandoc(html_path, "docx", output=docx_path)
+        return docx_path
+    return None
+
+
+# One scan handles scene breaks, chapter wrapping and heading ids: an <hr>, or a
+# heading with the chapter <section> opener / closer that may hug it.
+_TAG_RE = re.compile(r"<[^<]+?>")
+_POSTPROCESS_RE = re.compile(
+    r'<hr */?>'
+    r'|(?P<open><section class="chapter"[^>]*>\s*)?'
+    r'<h(?P<level>[1-6])(?P<attrs>[^>]*)>(?P<inner>.*?)</h(?P=level)>'
+    r'(?P<close>\s*</section>)?',
+    re.DOTALL,
+)
+# id attributes already in the body (pandoc section/heading ids, anchors)
+_ID_ATTR_RE = re.compile(r'(?<![\w-])id\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+
 def postprocess_body_html(html: str, cfg: BuildConfig) -> str:
     # Add simple TOC anchors, chapter-open class on h1 containers, scene break transformation
     # Insert a lightweight script to build a TOC (WeasyPrint supports limited JS; TOC is best-effort)
     # For stable PDF TOCs, rely on Pandoc when possible.
-    html = re.sub(r"<hr */?>", '<div class="hr-ornament"></div>', html)
 
     # If we already have <section class="chapter"> tags (from txt conversion), preserve them
-    # Otherwise, wrap h1 sections as chapter sections
-    if '<section class="chapter"' not in html:
-        # Wrap standalone h1 headings with section tags for EPUB chapter splitting
-        # Use a simple approach: wrap each h1 in a section tag
-        # First, find all h1 tags and wrap them
-        def wrap_h1_in_section(match):
-            return f'<section class="chapter">{match.group(0)}'
-
-        html = re.sub(r'(<h1[^>]*>.*?</h1>)', wrap_h1_in_section, html, flags=re.DOTALL)
-
-        # Close sections before the next h1 or at the end
-        html = re.sub(r'(</h1>)(?=.*?<section class="chapter">)', r'\1</section>', html, flags=re.DOTALL)
-        # Also wrap in div for PDF styling compatibility
-        html = re.sub(r"(<h1[^>]*>)", r'<div class="chapter-open">\1', html)
-        html = re.sub(r"(</h1>)", r"\1</div>", html)
-    else:
-        # We have section tags, just add the chapter-open div for PDF styling
-        html = re.sub(r'(<section class="chapter"[^>]*>\s*)(<h1[^>]*>)', r'\1<div class="chapter-open">\2', html)
-        html = re.sub(r'(</h1>)(\s*</section>)', r'\1</div>\2', html)
+    # and just add the chapter-open div for PDF styling. Otherwise wrap each h1 in a
+    # chapter section for EPUB splitting (closed after the heading, except the last one).
+    has_sections = '<section class="chapter"' in html
+    parts: List[str] = []
+    pos = 0
+    last_section_close = -1
+    # Heading ids -> last numeric suffix used for that base, so repeated titles
+    # ("Scene", "Notes") get foo, foo-2, ... instead of duplicate anchors. Seeded
+    # with the ids the body already has so a generated id never reuses one.
+    used_ids: Dict[str, int] = {
+        double or single: 1 for double, single in _ID_ATTR_RE.findall(html)
+    }
 
-    # Add IDs to headings for TOC (if they don't already have IDs)
-    def idify(match):
-        full_tag = match.group(0)
-        # Skip if already has an id attribute
-        if 'id=' in full_tag:
-            return full_tag
-        text = re.sub("<[^<]+?>", "", match.group(2))
-        sid = slugify(text)[:60] or "section"
-        return f"<h{match.group(1)} id=\"{sid}\">{match.group(2)}</h{match.group(1)}>"
+    for m in _POSTPROCESS_RE.finditer(html):
+        parts.append(html[pos:m.start()])
+        pos = m.end()
+        level = m.group("level")
+        if level is None:
+            parts.append('<div class="hr-ornament"></div>')
+            continue
 
-    html = re.sub(r"<h([1-6])>(.*?)</h\1>", idify, html)
-    return html
+        open_tag, attrs, inner, close_tag = m.group("open", "attrs", "inner", "close")
+        heading = f"<h{level}{attrs}>{inner}</h{level}>"
+        # Add IDs to headings for TOC (if they don't already have IDs)
+        if not attrs and "id=" not in inner and "\n" not in inner:
+            text = _TAG_RE.sub("", inner)
+            sid = base = slugify(text)[:60] or "section"
+            n = used_ids.get(base, 1)
+            while sid in used_ids:
+                n += 1
+                sid = f"{base}-{n}"
+            used_ids[base] = n
+            used_ids.setdefault(sid, 1)
+            heading = f"<h{level} id=\"{sid}\">{inner}</h{level}>"
+
+        if level != "1":
+            parts.append(f"{open_tag or ''}{heading}{close_tag or ''}")
+        elif has_sections:
+            if open_tag:
+                heading = f'{open_tag}<div class="chapter-open">{heading}'
+            if close_tag:
+                heading = f"{heading}</div>{close_tag}"
+            parts.append(heading)
+        else:
+            parts.append(f'<section class="chapter"><div class="chapter-open">{heading}</div>')
+            last_section_close = len(parts)
+            parts.append("</section>")
+            parts.append(close_tag or "")
+
+    if last_section_close >= 0:
+        parts[last_section_close] = ""
+    parts.append(html[pos:])
+    return "".join(parts)
 
 
-def render_base_css(cfg: BuildConfig) -> str:
-    trim = TRIM_PRESETS[cfg.trim]
-    return CSS_BASE_TEMPLATE.render(
+def _base_css_key(cfg: BuildConfig) -> tuple:
+    """The subset of BuildConfig fields that CSS_BASE_TEMPLATE actually reads."""
+    return (
+        cfg.trim,
+        cfg.top_margin_in,
+        cfg.bottom_margin_in,
+        cfg.gutter_in,
+        cfg.outer_margin_in,
+        cfg.font_family,
+        cfg.font_size_pt,
+        cfg.line_height,
+        cfg.hyphenate,
+        cfg.chapter_starts_right,
+        cfg.scene_break,
+        cfg.header_style,
+        cfg.author,
+        cfg.title,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_base_css(key: tuple) -> str:
+    (trim_key, top_margin_in, bottom_margin_in, gutter_in, outer_margin_in,
+     font_family, font_size_pt, line_height, hyphenate, chapter_starts_right,
+     scene_break, header_style, author, title) = key
+    trim = TRIM_PRESETS[trim_key]
+    return _compile_template(CSS_BASE_TEMPLATE).render(
         page_width_mm=inch_to_mm(trim["width_in"]),
         page_height_mm=inch_to_mm(trim["height_in"]),
-        top_margin_mm=inch_to_mm(cfg.top_margin_in),
-        bottom_margin_mm=inch_to_mm(cfg.bottom_margin_in),
-        gutter_mm=inch_to_mm(cfg.gutter_in),
-        outer_margin_mm=inch_to_mm(cfg.outer_margin_in),
-        font_family=cfg.font_family,
-        font_size_pt=cfg.font_size_pt,
-        line_height=cfg.line_height,
-        hyphenate=cfg.hyphenate,
-        chapter_starts_right=cfg.chapter_starts_right,
-        scene_break=cfg.scene_break,
-        header_style=cfg.header_style,
-        header_left=(cfg.author if cfg.header_style in ("author_title","author_only") else ""),
-        header_right=(cfg.title if cfg.header_style in ("author_title","title_only") else ""),
+        top_margin_mm=inch_to_mm(top_margin_in),
+        bottom_margin_mm=inch_to_mm(bottom_margin_in),
+        gutter_mm=inch_to_mm(gutter_in),
+        outer_margin_mm=inch_to_mm(outer_margin_in),
+        font_family=font_family,
+        font_size_pt=font_size_pt,
+        line_height=line_height,
+        hyphenate=hyphenate,
+        chapter_starts_right=chapter_starts_right,
+        scene_break=scene_break,
+        header_style=header_style,
+        header_left=(author if header_style in ("author_title","author_only") else ""),
+        header_right=(title if header_style in ("author_title","title_only") else ""),
     )
 
 
+def render_base_css(cfg: BuildConfig) -> str:
+    # Rendered once per distinct layout; batch builds with the same preset reuse it
+    return _render_base_css(_base_css_key(cfg))
+
+
 def render_full_html(cfg: BuildConfig, body_html: str) -> str:
+    return _compile_template(HTML_TEMPLATE).render(**_full_html_context(cfg, body_html))
+
+
+def write_full_html(cfg: BuildConfig, body_html: str, path: Path) -> None:
+    # Stream the rendered template into the file instead of building the whole
+    # document as one string first
+    _compile_template(HTML_TEMPLATE).stream(**_full_html_context(cfg, body_html)).dump(
+        str(path), encoding="utf-8")
+
+
+def _full_html_context(cfg: BuildConfig, body_html: str) -> Dict[str, Any]:
     base_css = render_base_css(cfg)
-    return HTML_TEMPLATE.render(
+    return dict(
         language=cfg.language,
         title=cfg.title,
         subtitle=cfg.subtitle,
@@ -1207,9 +1420,12 @@ def render_full_html(cfg: BuildConfig, body_html: str) -> str:
 # Cover calculator (spine & full cover size)
 # ----------------------
 
+# Inches per page for each stock, so the spine width is a single multiply
+_INV_PPI = {k: 1.0 / v['pages_per_inch'] for k, v in PAPER_STOCKS.items()}
+
+
 def calc_spine_width_in(page_count: int, paper: str) -> float:
-    ppi = PAPER_STOCKS.get(paper, PAPER_STOCKS["cream_55lb"])['pages_per_inch']
-    return round(page_count / ppi, 3)
+    return round(page_count * _INV_PPI.get(paper, _INV_PPI["cream_55lb"]), 3)
 
 
 def cover_dimensions(trim_key: str, page_count: int, paper: str, bleed: bool = False) -> Dict[str, float]:
@@ -1226,7 +1442,9 @@ def cover_dimensions(trim_key: str, page_count: int, paper: str, bleed: bool = F
 # ----------------------
 
 def load_config(path: Path) -> BuildConfig:
-    data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    import yaml
+    loader, _ = _yaml_safe_loader_dumper()
+    data = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=loader)
     return BuildConfig(**data)
 
 
@@ -1238,7 +1456,9 @@ def cmd_wizard(args):
     manuscript = Path(args.manuscript)
     outdir = Path(args.outdir or (manuscript.parent / "bookforge_build"))
     cfg = run_wizard(manuscript, outdir)
-    build_outputs(cfg, manuscript, outdir)
+    if args.fast_preview:
+        cfg.fast_preview = True
+    build_outputs(cfg, manuscript, outdir, only=args.only)
 
 
 def cmd_build(args):
@@ -1247,7 +1467,9 @@ def cmd_build(args):
     cfg = load_config(Path(args.config)) if args.config else None
     if not cfg:
         raise SystemExit("--config is required for build mode (or use wizard)")
-    build_outputs(cfg, manuscript, outdir)
+    if args.fast_preview:
+        cfg.fast_preview = True
+    build_outputs(cfg, manuscript, outdir, only=args.only)
 
 
 def cmd_covercalc(args):
@@ -1262,12 +1484,18 @@ def main():
     p_wiz = sub.add_parser('wizard', help='Run interactive wizard and build outputs')
     p_wiz.add_argument('manuscript', help='Path to manuscript (.docx/.md/.txt)')
     p_wiz.add_argument('--outdir', help='Output directory (default: manuscript_dir/bookforge_build)')
+    p_wiz.add_argument('--only', type=parse_outputs, help='Outputs to build, e.g. html,pdf (default: all)')
+    p_wiz.add_argument('--fast-preview', action='store_true',
+                       help='Quicker draft build: no recto chapter starts, hyphenation or TOC')
     p_wiz.set_defaults(func=cmd_wizard)
 
     p_build = sub.add_parser('build', help='Build using an existing YAML config')
     p_build.add_argument('--config', required=True, help='bookforge.yml')
     p_build.add_argument('--manuscript', required=True, help='Path to manuscript')
     p_build.add_argument('--outdir', help='Output directory')
+    p_build.add_argument('--only', type=parse_outputs, help='Outputs to build, e.g. html,pdf (default: all)')
+    p_build.add_argument('--fast-preview', action='store_true',
+                         help='Quicker draft build: no recto chapter starts, hyphenation or TOC')
     p_build.set_defaults(func=cmd_build)
 
     p_cover = sub.add_parser('covercalc', help='Calculate full cover/spine dimensions')
@@ -3,9 +3,17 @@ Document Processing Utilities
 Handles extraction of content from various document formats
 """
 
+import base64
+import functools
+import html as html_lib
 import logging
+import os
+import threading
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+from xml.etree import ElementTree
 import re
 
 logger = logging.getLogger(__name__)
@@ -24,13 +32,6 @@ except ImportError:
     RTF_AVAILABLE = False
     logger.warning("striprtf not available. RTF extraction will be limited.")
 
-try:
-    import odf.odf
-    ODF_AVAILABLE = True
-except ImportError:
-    ODF_AVAILABLE = False
-    logger.warning("odfpy not available. ODT extraction will be limited.")
-
 try:
     import markdown
     MARKDOWN_AVAILABLE = True
@@ -43,7 +44,78 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+# Compiled once at import; these run per paragraph / per file.
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+# Tags plus the markup get_text() never returns: comments and script/style bodies
+_MARKUP_RE = re.compile(
+    r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]+>', re.DOTALL | re.IGNORECASE
+)
+# RTF control words and group braces, stripped together in one pass
+_RTF_MARKUP_RE = re.compile(r'\\[a-z]+\d*\s?|[{}]')
+_P_ELEMENT_RE = re.compile(r'<p\b[^>]*>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+
+# Chapter patterns, matched against upper-cased text:
+#   "CHAPTER ONE", "CHAPTER TWENTY-ONE:", "CHAPTER ONE: The Invitation"
+#   "CHAPTER 1", "CHAPTER 1: Title"
+#   "PART I", "PART II", "PART 1", "PART 2"
+#   "PROLOGUE", "EPILOGUE"
+_CHAPTER_HEADING_RE = re.compile(
+    r'CHAPTER\s+(?:[A-Z]+|\d+)'
+    r'|PART\s+(?:[IVX]+|\d+)'
+    r'|PROLOGUE'
+    r'|EPILOGUE'
+)
+
+_ODF_TEXT_NS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+_ODT_PARAGRAPH_TAGS = (_ODF_TEXT_NS + 'p', _ODF_TEXT_NS + 'h')
+
+_T = TypeVar('_T')
+
+# Styled chapter headings get the same markup _detect_chapters_in_html emits
+_MAMMOTH_STYLE_MAP = "p[style-name='Heading 1'] => h1.chapter-title:fresh"
+
+# Recent extraction results keyed on (function, path, mtime, size), so the text
+# and HTML extract calls for the same saved upload reuse the mammoth/BeautifulSoup
+# work, and a file rewritten in place is read afresh.
+_EXTRACT_CACHE_SIZE = 4
+_extract_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_extract_cache_lock = threading.Lock()
+
+
+def _cached_result(result):
+    # Dict results are handed out as copies so a caller editing one can't
+    # change what later callers get back for the same file
+    return dict(result) if isinstance(result, dict) else result
+
+
+def _cached_by_stat(func: Callable[[Path], Optional[_T]]) -> Callable[[Path], Optional[_T]]:
+    """Memoize an extractor per file version; failed (None) results are not cached"""
+    @functools.wraps(func)
+    def wrapper(file_path: Path) -> Optional[_T]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return func(file_path)
+
+        key = (func.__name__, str(file_path), st.st_mtime_ns, st.st_size)
+        with _extract_cache_lock:
+            if key in _extract_cache:
+                _extract_cache.move_to_end(key)
+                return _cached_result(_extract_cache[key])
+
+        result = func(file_path)
+        if result is not None:
+            with _extract_cache_lock:
+                _extract_cache[key] = result
+                while len(_extract_cache) > _EXTRACT_CACHE_SIZE:
+                    _extract_cache.popitem(last=False)
+        return _cached_result(result)
 
+    return wrapper
+
+
+@_cached_by_stat
 def extract_text_from_file(file_path: Path) -> Optional[str]:
     """
     Extract plain text from various document formats
@@ -80,6 +152,7 @@ def extract_text_from_file(file_path: Path) -> Optional[str]:
         return None
 
 
+@_cached_by_stat
 def extract_html_from_file(file_path: Path) -> Optional[dict]:
     """
     Extract HTML content with embedded images from document files
@@ -105,43 +178,39 @@ def extract_html_from_file(file_path: Path) -> Optional[dict]:
         else:
             # For other formats, return text wrapped in HTML
             text_content = extract_text_from_file(file_path)
-            if text_content:
-                # Escape HTML and wrap in <pre> tag to preserve formatting
-                import html
-                escaped_text = html.escape(text_content)
-                return {'html': f'<pre style="white-space: pre-wrap; font-family: inherit;">{escaped_text}</pre>', 'format': 'text'}
-            return None
+            return _text_as_html(text_content) if text_content else None
             
     except Exception as e:
         logger.error(f"Error extracting HTML from {file_path}: {e}")
         return None
 
 
+def _text_as_html(text: str) -> dict:
+    """Escape plain text and wrap it in a <pre> tag to preserve formatting"""
+    escaped_text = html_lib.escape(text)
+    return {'html': f'<pre style="white-space: pre-wrap; font-family: inherit;">{escaped_text}</pre>', 'format': 'text'}
+
+
 def _extract_txt(file_path: Path) -> str:
     """Extract text from plain text file"""
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        return f.read()
+    return file_path.read_text(encoding='utf-8', errors='ignore')
 
 
 def _extract_markdown(file_path: Path) -> str:
     """Extract text from Markdown file"""
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
+    content = file_path.read_text(encoding='utf-8', errors='ignore')
         
     if MARKDOWN_AVAILABLE:
         # Convert markdown to HTML then extract text
         html = markdown.markdown(content)
-        if BS4_AVAILABLE:
-            soup = BeautifulSoup(html, 'html.parser')
-            return soup.get_text()
+        return html_lib.unescape(_MARKUP_RE.sub('', html))
     
     return content
 
 
 def _extract_html(file_path: Path) -> str:
     """Extract text from HTML file"""
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        html_content = f.read()
+    html_content = file_path.read_text(encoding='utf-8', errors='ignore')
     
     if BS4_AVAILABLE:
         soup = BeautifulSoup(html_content, 'html.parser')
@@ -151,8 +220,8 @@ def _extract_html(file_path: Path) -> str:
         return soup.get_text(separator='\n', strip=True)
     
     # Fallback: simple regex extraction
-    text = re.sub(r'<[^>]+>', '', html_content)
-    text = re.sub(r'\s+', ' ', text)
+    text = _TAG_RE.sub('', html_content)
+    text = _WS_RE.sub(' ', text)
     return text.strip()
 
 
@@ -177,12 +246,15 @@ def _extract_docx_html(file_path: Path) -> Optional[dict]:
             def convert_image(image):
                 """Convert images to base64 data URLs"""
                 with image.open() as image_bytes:
-                    import base64
                     encoded_src = base64.b64encode(image_bytes.read()).decode("ascii")
                     return {"src": f"data:{image.content_type};base64,{encoded_src}"}
             
             with open(file_path, 'rb') as f:
-                result = mammoth.convert_to_html(f, convert_image=mammoth.images.img_element(convert_image))
+                result = mammoth.convert_to_html(
+                    f,
+                    convert_image=mammoth.images.img_element(convert_image),
+                    style_map=_MAMMOTH_STYLE_MAP,
+                )
                 html_content = result.value
                 
                 # Log any conversion messages
@@ -198,26 +270,17 @@ def _extract_docx_html(file_path: Path) -> Optional[dict]:
             logger.error(f"Error using mammoth to extract HTML: {e}")
             # Fallback to text extraction
             text = _extract_docx_fallback(file_path)
-            if text:
-                import html
-                escaped_text = html.escape(text)
-                return {'html': f'<pre style="white-space: pre-wrap; font-family: inherit;">{escaped_text}</pre>', 'format': 'text'}
-            return None
+            return _text_as_html(text) if text else None
     else:
         # Fallback to text extraction
         text = _extract_docx_fallback(file_path)
-        if text:
-            import html
-            escaped_text = html.escape(text)
-            return {'html': f'<pre style="white-space: pre-wrap; font-family: inherit;">{escaped_text}</pre>', 'format': 'text'}
-        return None
+        return _text_as_html(text) if text else None
 
 
 def _extract_html_raw(file_path: Path) -> Optional[str]:
     """Extract raw HTML content from HTML file"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
+        return file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
         logger.error(f"Error reading HTML file: {e}")
         return None
@@ -226,15 +289,13 @@ def _extract_html_raw(file_path: Path) -> Optional[str]:
 def _extract_markdown_html(file_path: Path) -> Optional[str]:
     """Extract HTML from Markdown file"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         if MARKDOWN_AVAILABLE:
             return markdown.markdown(content)
         else:
             # Simple fallback: wrap in <pre>
-            import html
-            escaped = html.escape(content)
+            escaped = html_lib.escape(content)
             return f'<pre style="white-space: pre-wrap;">{escaped}</pre>'
     except Exception as e:
         logger.error(f"Error converting markdown to HTML: {e}")
@@ -260,18 +321,43 @@ def _extract_doc(file_path: Path) -> str:
     return f"[Legacy .doc file - conversion to text not fully supported: {file_path.name}]"
 
 
+def _odt_element_text(elem: ElementTree.Element) -> str:
+    """Text of an ODF element, expanding <text:s>, <text:tab> and <text:line-break>"""
+    parts = [elem.text or '']
+    for child in elem:
+        if child.tag == _ODF_TEXT_NS + 's':
+            parts.append(' ' * int(child.get(_ODF_TEXT_NS + 'c', 1)))
+        elif child.tag == _ODF_TEXT_NS + 'tab':
+            parts.append('\t')
+        elif child.tag == _ODF_TEXT_NS + 'line-break':
+            parts.append('\n')
+        else:
+            parts.append(_odt_element_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
 def _extract_odt(file_path: Path) -> str:
     """Extract text from ODT file"""
     try:
-        from odf.opendocument import load
-        from odf.text import P
-        
-        doc = load(file_path)
         text_content = []
-        
-        for paragraph in doc.getElementsByType(P):
-            text_content.append(paragraph.astext())
-        
+        depth = 0
+
+        # Stream content.xml and free each paragraph once read instead of
+        # loading the whole document tree
+        with zipfile.ZipFile(file_path) as zf, zf.open('content.xml') as xml:
+            for event, elem in ElementTree.iterparse(xml, events=('start', 'end')):
+                if elem.tag not in _ODT_PARAGRAPH_TAGS:
+                    continue
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                # Paragraphs nested in footnotes, frames etc. are part of the outer one
+                if depth == 0:
+                    text_content.append(_odt_element_text(elem))
+                    elem.clear()
+
         return '\n\n'.join(text_content)
     except Exception as e:
         logger.error(f"Error extracting ODT: {e}")
@@ -282,22 +368,18 @@ def _extract_rtf(file_path: Path) -> str:
     """Extract text from RTF file"""
     if RTF_AVAILABLE:
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                rtf_content = f.read()
+            rtf_content = file_path.read_text(encoding='utf-8', errors='ignore')
             return rtf_to_text(rtf_content)
         except Exception as e:
             logger.error(f"Error extracting RTF: {e}")
             return f"[RTF file could not be parsed: {file_path.name}]"
     else:
         # Simple fallback: strip RTF codes
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        # Remove RTF control words
-        text = re.sub(r'\\[a-z]+\d*\s?', '', content)
-        # Remove braces
-        text = re.sub(r'[{}]', '', text)
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        # Remove RTF control words and braces
+        text = _RTF_MARKUP_RE.sub('', content)
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
 
 
@@ -306,45 +388,32 @@ def _detect_chapters_in_html(html: str) -> str:
     Post-process HTML to detect chapter headings and convert them to proper h1 headings.
     This handles cases where chapter titles are in paragraphs instead of heading tags.
     """
-    try:
-        from bs4 import BeautifulSoup
-        
-        if not BS4_AVAILABLE:
-            return html
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        chapter_count = 0
-        
-        # Find all paragraphs
-        paragraphs = soup.find_all('p')
-        
-        for p in paragraphs:
-            text_content = p.get_text(strip=True)
-            
-            # Check if this paragraph looks like a chapter heading
-            if _is_chapter_heading(text_content):
-                # Create a new section and h1 heading
-                chapter_count += 1
-                heading_id = f"chapter-{chapter_count}"
-                
-                # Create section wrapper
-                section = soup.new_tag('section', class_='chapter', id=heading_id)
-                
-                # Create h1 heading
-                h1 = soup.new_tag('h1', class_='chapter-title')
-                h1.string = text_content
-                
-                # Replace paragraph with section containing h1
-                section.append(h1)
-                p.replace_with(section)
-                
-                logger.info(f"Detected chapter heading: {text_content[:50]}...")
-        
-        return str(soup)
-        
-    except Exception as e:
-        logger.warning(f"Error detecting chapters in HTML: {e}")
-        return html
+    chapter_count = 0
+
+    def replace_paragraph(match: re.Match) -> str:
+        nonlocal chapter_count
+        # Same text as BeautifulSoup's get_text(strip=True): each text node
+        # stripped, then concatenated
+        text_content = ''.join(
+            html_lib.unescape(piece).strip() for piece in _TAG_RE.split(match.group(1))
+        )
+
+        # Check if this paragraph looks like a chapter heading
+        if not _is_chapter_heading(text_content):
+            return match.group(0)
+
+        chapter_count += 1
+        heading_id = f"chapter-{chapter_count}"
+        logger.info(f"Detected chapter heading: {text_content[:50]}...")
+
+        # Replace paragraph with section containing h1
+        return (
+            f'<section class="chapter" id="{heading_id}">'
+            f'<h1 class="chapter-title">{html_lib.escape(text_content, quote=False)}</h1>'
+            '</section>'
+        )
+
+    return _P_ELEMENT_RE.sub(replace_paragraph, html)
 
 
 def _is_chapter_heading(text: str) -> bool:
@@ -356,26 +425,4 @@ def _is_chapter_heading(text: str) -> bool:
         return False
     
     text_upper = text.upper().strip()
-    
-    # Common chapter patterns
-    patterns = [
-        r'^CHAPTER\s+[A-Z]+[\w\s-]*:?',  # "CHAPTER ONE", "CHAPTER TWENTY-ONE:"
-        r'^CHAPTER\s+\d+',  # "CHAPTER 1", "CHAPTER 21"
-        r'^CHAPTER\s+[A-Z]+[\w\s-]*:.*',  # "CHAPTER ONE: The Invitation"
-        r'^CHAPTER\s+\d+:.*',  # "CHAPTER 1: Title"
-        r'^PART\s+[IVX]+',  # "PART I", "PART II"
-        r'^PART\s+\d+',  # "PART 1", "PART 2"
-        r'^PROLOGUE',
-        r'^EPILOGUE',
-    ]
-    
-    for pattern in patterns:
-        if re.match(pattern, text_upper):
-            return True
-    
-    # Also check for "Chapter" followed by number word or number
-    if re.match(r'^CHAPTER\s+[A-Z]+[\w\s-]*:?', text_upper):
-        return True
-    
-    return False
-
+    return _CHAPTER_HEADING_RE.match(text_upper) is not None
@@ -12,27 +12,26 @@ Uses python-docx for direct document creation with:
 """
 
 import re
+import functools
+import html as html_lib
+import importlib.util
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
-try:
-    from docx import Document
-    from docx.shared import Pt, Inches, Twips, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-    from docx.enum.style import WD_STYLE_TYPE
-    from docx.enum.section import WD_ORIENT
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# python-docx (and lxml under it) is imported by the functions that build a
+# document, so importing this module for the manuscript parser stays cheap
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+if not DOCX_AVAILABLE:
     logger.warning("python-docx not available. Professional DOCX generation disabled.")
 
+if TYPE_CHECKING:
+    from docx import Document
+
 
 class ContentType(Enum):
     """Types of content in a manuscript"""
@@ -46,7 +45,7 @@ class ContentType(Enum):
     BLANK = "blank"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """A block of content with its type and text"""
     content_type: ContentType
@@ -54,7 +53,7 @@ class ContentBlock:
     level: int = 1  # Heading level (1 for chapter, 2 for section, etc.)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocxConfig:
     """Configuration for DOCX generation"""
     title: str
@@ -132,6 +131,59 @@ BACK_MATTER_PATTERNS = [
     r'^BONUS',
 ]
 
+_HEADING_TYPES = {
+    'chapter': (ContentType.CHAPTER_HEADING, 1),
+    'front': (ContentType.FRONT_MATTER_HEADING, 2),
+    'back': (ContentType.BACK_MATTER_HEADING, 2),
+}
+# Heading categories, in the order their patterns are tried
+_HEADING_PATTERNS = (
+    ('chapter', CHAPTER_PATTERNS),
+    ('front', FRONT_MATTER_PATTERNS),
+    ('back', BACK_MATTER_PATTERNS),
+)
+
+
+def _compile_heading_re(prefix: str):
+    """One alternation of the patterns starting with prefix, a named group per category"""
+    groups = []
+    for name, patterns in _HEADING_PATTERNS:
+        matching = [f'(?:{p})' for p in patterns if p[1:3] == prefix]
+        if matching:
+            groups.append(f"(?P<{name}>{'|'.join(matching)})")
+    return re.compile('|'.join(groups))
+
+
+# Every heading pattern opens with a literal two-letter word start ("CH", "PR",
+# "AC", ...), so a line is dispatched on its first two characters and only tried
+# against the few patterns sharing them. Keys cover both cases of each letter, so
+# most body text ("And", "But", "In") misses without any upper() copy being made.
+_HEADING_RES = {
+    first + second: regex
+    for prefix, regex in (
+        (prefix, _compile_heading_re(prefix))
+        for prefix in {p[1:3] for _, patterns in _HEADING_PATTERNS for p in patterns}
+    )
+    for first in (prefix[0], prefix[0].lower())
+    for second in (prefix[1], prefix[1].lower())
+}
+_SCENE_BREAK_RE = re.compile(r'^[\*\-\~\#]{3,}$')
+# First characters a scene break can start with
+_SCENE_BREAK_CHARS = frozenset('*-~#')
+
+# Prebuilt results for the per-line hot path: Enum member access goes through the
+# EnumType metaclass and costs several times a plain global lookup
+_BLANK_LINE = (ContentType.BLANK, 0)
+_PARAGRAPH_LINE = (ContentType.PARAGRAPH, 0)
+_SCENE_BREAK_LINE = (ContentType.SCENE_BREAK, 0)
+# Line types that form a block of their own instead of joining a paragraph
+_STANDALONE_TYPES = (
+    ContentType.CHAPTER_HEADING,
+    ContentType.FRONT_MATTER_HEADING,
+    ContentType.BACK_MATTER_HEADING,
+    ContentType.SCENE_BREAK,
+)
+
 
 def detect_content_type(line: str) -> Tuple[ContentType, int]:
     """
@@ -140,33 +192,36 @@ def detect_content_type(line: str) -> Tuple[ContentType, int]:
     Returns:
         Tuple of (ContentType, heading_level)
     """
-    stripped = line.strip()
-    if not stripped:
-        return ContentType.BLANK, 0
-
-    upper = stripped.upper()
-
-    # Scene breaks (multiple asterisks, dashes, or other ornaments)
-    if re.match(r'^[\*\-\~\#]{3,}$', stripped) or stripped in ['***', '* * *', '---', '~~~']:
-        return ContentType.SCENE_BREAK, 0
-
-    # Check for chapter headings
-    for pattern in CHAPTER_PATTERNS:
-        if re.match(pattern, upper):
-            return ContentType.CHAPTER_HEADING, 1
+    return _classify_stripped(line.strip())
 
-    # Check for front matter headings
-    for pattern in FRONT_MATTER_PATTERNS:
-        if re.match(pattern, upper):
-            return ContentType.FRONT_MATTER_HEADING, 2
 
-    # Check for back matter headings
-    for pattern in BACK_MATTER_PATTERNS:
-        if re.match(pattern, upper):
-            return ContentType.BACK_MATTER_HEADING, 2
+def _classify_stripped(stripped: str) -> Tuple[ContentType, int]:
+    """detect_content_type for a line that has already been stripped"""
+    if not stripped:
+        return _BLANK_LINE
+
+    # Scene breaks (multiple asterisks, dashes, or other ornaments); no heading
+    # starts with one of these characters
+    if stripped[0] in _SCENE_BREAK_CHARS:
+        if _SCENE_BREAK_RE.match(stripped) or stripped in ['***', '* * *', '---', '~~~']:
+            return _SCENE_BREAK_LINE
+        return _PARAGRAPH_LINE
+
+    # Check for chapter, front matter and back matter headings. Non-ASCII characters
+    # can upper-case to ASCII letters (e.g. U+0131, U+FB01), so those prefixes are
+    # looked up again upper-cased; upper() is per character, which makes the prefix
+    # of the upper-cased line prefix.upper()[:2].
+    prefix = stripped[:2]
+    heading_re = _HEADING_RES.get(prefix)
+    if heading_re is None and not prefix.isascii():
+        heading_re = _HEADING_RES.get(prefix.upper()[:2])
+    if heading_re is not None:
+        match = heading_re.match(stripped.upper())
+        if match:
+            return _HEADING_TYPES[match.lastgroup]
 
     # Regular paragraph
-    return ContentType.PARAGRAPH, 0
+    return _PARAGRAPH_LINE
 
 
 def parse_manuscript(content: str) -> List[ContentBlock]:
@@ -179,52 +234,62 @@ def parse_manuscript(content: str) -> List[ContentBlock]:
     Returns:
         List of ContentBlock objects
     """
-    lines = content.split('\n')
-    blocks: List[ContentBlock] = []
+    return list(iter_manuscript_blocks(content))
+
+
+def iter_manuscript_blocks(content: str) -> Iterator[ContentBlock]:
+    """
+    Yield the blocks of parse_manuscript one at a time, so a caller that
+    consumes them in order never holds the whole list.
+    """
     current_paragraph_lines: List[str] = []
     blank_count = 0
+    blank_type = ContentType.BLANK
 
-    def flush_paragraph():
-        """Flush accumulated paragraph lines into a block"""
-        nonlocal current_paragraph_lines
-        if current_paragraph_lines:
-            text = ' '.join(current_paragraph_lines)
-            # Clean up extra spaces
-            text = re.sub(r'\s+', ' ', text).strip()
-            if text:
-                blocks.append(ContentBlock(ContentType.PARAGRAPH, text))
-            current_paragraph_lines = []
-
-    for line in lines:
+    # Split on '\n' only: other line boundaries str.splitlines() knows (\x0c, \x85,
+    # \u2028, ...) are whitespace inside a paragraph here
+    for line in content.split('\n'):
         stripped = line.strip()
-        content_type, level = detect_content_type(stripped)
+        content_type, level = _classify_stripped(stripped)
 
-        if content_type == ContentType.BLANK:
+        if content_type is blank_type:
             blank_count += 1
-            # Multiple blank lines might indicate a scene break or section end
-            if blank_count >= 3 and current_paragraph_lines:
-                flush_paragraph()
-                blocks.append(ContentBlock(ContentType.SCENE_BREAK, ""))
-            elif blank_count >= 1:
-                # Single blank line ends current paragraph
-                flush_paragraph()
+            # A blank line ends the current paragraph
+            if current_paragraph_lines:
+                yield from _paragraph_block(current_paragraph_lines)
+                current_paragraph_lines = []
+                # Multiple blank lines might indicate a scene break or section end
+                if blank_count >= 3:
+                    yield ContentBlock(ContentType.SCENE_BREAK, "")
             continue
 
         blank_count = 0
 
-        if content_type in [ContentType.CHAPTER_HEADING, ContentType.FRONT_MATTER_HEADING,
-                            ContentType.BACK_MATTER_HEADING, ContentType.SCENE_BREAK]:
+        if content_type in _STANDALONE_TYPES:
             # Flush any pending paragraph
-            flush_paragraph()
-            blocks.append(ContentBlock(content_type, stripped, level))
+            if current_paragraph_lines:
+                yield from _paragraph_block(current_paragraph_lines)
+                current_paragraph_lines = []
+            yield ContentBlock(content_type, stripped, level)
         else:
             # Accumulate paragraph lines
             current_paragraph_lines.append(stripped)
 
     # Flush final paragraph
-    flush_paragraph()
+    yield from _paragraph_block(current_paragraph_lines)
+
+
+def _paragraph_block(lines: List[str]) -> Iterator[ContentBlock]:
+    """The paragraph block for accumulated lines, if any text remains"""
+    # Clean up extra spaces (str.split() splits on exactly the characters \s matches)
+    text = ' '.join(' '.join(lines).split())
+    if text:
+        yield ContentBlock(ContentType.PARAGRAPH, text)
 
-    return blocks
+
+# Redundant chapter titles: "Chapter X: Chapter Word:" and "Chapter Word: Chapter X:"
+_NUMBER_THEN_WORD_TITLE_RE = re.compile(r'^(CHAPTER\s+\d+):\s*(CHAPTER\s+[A-Z]+[\w\s-]*:)', re.IGNORECASE)
+_WORD_THEN_NUMBER_TITLE_RE = re.compile(r'^(CHAPTER\s+[A-Z]+[\w\s-]*):\s*(CHAPTER\s+\d+:)', re.IGNORECASE)
 
 
 def clean_chapter_title(title: str) -> str:
@@ -232,13 +297,17 @@ def clean_chapter_title(title: str) -> str:
     Clean up redundant chapter titles like 'Chapter 1: Chapter One: Title'
     to just 'Chapter One: Title' or 'Chapter 1: Title'
     """
+    # Both patterns need "CHAPTER" twice; most titles have it once at most
+    if title.upper().count('CHAPTER') < 2:
+        return title
+
     # Pattern: "Chapter X: Chapter Word:" -> just "Chapter Word:"
-    match = re.match(r'^(CHAPTER\s+\d+):\s*(CHAPTER\s+[A-Z]+[\w\s-]*:)', title, re.IGNORECASE)
+    match = _NUMBER_THEN_WORD_TITLE_RE.match(title)
     if match:
         return match.group(2).strip()
 
     # Pattern: "Chapter Word: Chapter X:" -> just "Chapter Word:"
-    match = re.match(r'^(CHAPTER\s+[A-Z]+[\w\s-]*):\s*(CHAPTER\s+\d+:)', title, re.IGNORECASE)
+    match = _WORD_THEN_NUMBER_TITLE_RE.match(title)
     if match:
         return match.group(1).strip() + ':'
 
@@ -260,11 +329,10 @@ def create_professional_docx(content: str, config: DocxConfig, output_path: Path
     if not DOCX_AVAILABLE:
         raise RuntimeError("python-docx is not available. Install it with: pip install python-docx")
 
-    logger.info(f"Creating professional DOCX: {output_path}")
+    from docx import Document
+    from docx.shared import Inches
 
-    # Parse the manuscript
-    blocks = parse_manuscript(content)
-    logger.info(f"Parsed {len(blocks)} content blocks")
+    logger.info(f"Creating professional DOCX: {output_path}")
 
     # Create document
     doc = Document()
@@ -279,7 +347,7 @@ def create_professional_docx(content: str, config: DocxConfig, output_path: Path
     section.right_margin = Inches(config.right_margin_inches)
 
     # Create custom styles
-    _create_styles(doc, config)
+    _apply_styles(doc, config)
 
     # Add title page if configured
     if config.include_title_page:
@@ -293,48 +361,62 @@ def create_professional_docx(content: str, config: DocxConfig, output_path: Path
     if config.include_dedication and config.dedication_text:
         _add_dedication_page(doc, config)
 
+    # Resolve body style ids once; the manuscript body is built as XML text
+    # and spliced in after the loop (see _append_body_xml)
+    body = doc.element.body
+    style_ids = {
+        name: doc.styles[name].style_id
+        for name in ('ChapterHeading', 'SectionHeading', 'SceneBreak', 'FirstParagraph', 'BodyText')
+    }
+
+    fragments = []
+
     # Track chapter count for logging
     chapter_count = 0
     is_first_paragraph_in_chapter = False
 
-    # Process content blocks
-    for i, block in enumerate(blocks):
+    # Parse the manuscript and process its content blocks as they are produced
+    block_count = 0
+    for block_count, block in enumerate(iter_manuscript_blocks(content), 1):
         if block.content_type == ContentType.CHAPTER_HEADING:
             chapter_count += 1
             # Add page break before chapter (except first)
             if chapter_count > 1 or config.include_title_page:
-                doc.add_page_break()
+                fragments.append(_PAGE_BREAK_XML)
 
             # Clean up redundant chapter titles
             clean_title = clean_chapter_title(block.text)
 
             # Add chapter heading
-            para = doc.add_paragraph(clean_title, style='ChapterHeading')
+            fragments.append(_paragraph_xml(clean_title, style_ids['ChapterHeading']))
             is_first_paragraph_in_chapter = True
             logger.debug(f"Added chapter: {clean_title[:50]}...")
 
         elif block.content_type == ContentType.FRONT_MATTER_HEADING:
-            doc.add_page_break()
-            para = doc.add_paragraph(block.text, style='SectionHeading')
+            fragments.append(_PAGE_BREAK_XML)
+            fragments.append(_paragraph_xml(block.text, style_ids['SectionHeading']))
             is_first_paragraph_in_chapter = True
 
         elif block.content_type == ContentType.BACK_MATTER_HEADING:
-            doc.add_page_break()
-            para = doc.add_paragraph(block.text, style='SectionHeading')
+            fragments.append(_PAGE_BREAK_XML)
+            fragments.append(_paragraph_xml(block.text, style_ids['SectionHeading']))
             is_first_paragraph_in_chapter = True
 
         elif block.content_type == ContentType.SCENE_BREAK:
             # Add scene break ornament
-            para = doc.add_paragraph(config.scene_break_symbol, style='SceneBreak')
+            fragments.append(_paragraph_xml(config.scene_break_symbol, style_ids['SceneBreak']))
 
         elif block.content_type == ContentType.PARAGRAPH:
             if block.text:
                 # Use different style for first paragraph after heading (no indent)
                 if is_first_paragraph_in_chapter:
-                    para = doc.add_paragraph(block.text, style='FirstParagraph')
+                    fragments.append(_paragraph_xml(block.text, style_ids['FirstParagraph']))
                     is_first_paragraph_in_chapter = False
                 else:
-                    para = doc.add_paragraph(block.text, style='BodyText')
+                    fragments.append(_paragraph_xml(block.text, style_ids['BodyText']))
+
+    logger.info(f"Parsed {block_count} content blocks")
+    _append_body_xml(body, fragments)
 
     # Add about author if configured
     if config.include_about_author and config.about_author_text:
@@ -352,12 +434,89 @@ def create_professional_docx(content: str, config: DocxConfig, output_path: Path
     return output_path
 
 
-def _create_styles(doc: Document, config: DocxConfig):
+# Run text characters python-docx turns into elements instead of <w:t> text
+_RUN_SPECIAL_RE = re.compile(r'([\t\r\n])')
+
+_PAGE_BREAK_XML = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+def _paragraph_xml(text: str, style_id: str) -> str:
+    """
+    Serialize a paragraph as doc.add_paragraph(text, style=...) would build it:
+    tabs become <w:tab/>, CR/LF become <w:br/>, and <w:t> keeps xml:space="preserve"
+    when it has leading or trailing whitespace.
+    """
+    run = []
+    for piece in _RUN_SPECIAL_RE.split(text):
+        if piece == '\t':
+            run.append('<w:tab/>')
+        elif piece == '\r' or piece == '\n':
+            run.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            run.append(f'<w:t{space}>{html_lib.escape(piece, quote=False)}</w:t>')
+    run_xml = f"<w:r>{''.join(run)}</w:r>" if text else ''
+    return f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>{run_xml}</w:p>'
+
+
+def _append_body_xml(body, fragments: List[str]):
+    """
+    Parse the pre-built paragraph XML in one go and splice it in ahead of the
+    body's sectPr. Adding paragraphs one at a time through python-docx rescans
+    the body for sectPr on every insert, which is quadratic in book length.
+    """
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    if not fragments:
+        return
+    container = parse_xml(f"<w:body {nsdecls('w')}>{''.join(fragments)}</w:body>")
+    sect_pr = body.sectPr
+    index = body.index(sect_pr) if sect_pr is not None else len(body)
+    body[index:index] = list(container)
+
+
+# DocxConfig fields _create_styles reads; documents that agree on them get the same styles part
+_STYLE_FIELDS = (
+    'heading_font', 'body_font', 'chapter_font_size_pt', 'title_font_size_pt',
+    'body_font_size_pt', 'line_spacing', 'first_line_indent_inches',
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _styles_part_xml(style_values: tuple) -> bytes:
+    """Serialized styles part of a fresh document after _create_styles"""
+    from docx import Document
+    from lxml import etree
+
+    scratch = Document()
+    _create_styles(scratch, DocxConfig(title='', **dict(zip(_STYLE_FIELDS, style_values))))
+    return etree.tostring(scratch.styles.element)
+
+
+def _apply_styles(doc: 'Document', config: DocxConfig):
+    """
+    Give doc the custom styles. Building them through python-docx is a sizeable
+    share of the fixed cost per document, so the result is cached per style
+    settings and copied into the (still pristine) styles part of each new document.
+    """
+    from docx.oxml import parse_xml
+
+    styles_xml = _styles_part_xml(tuple(getattr(config, f) for f in _STYLE_FIELDS))
+    doc.styles.element[:] = list(parse_xml(styles_xml))
+
+
+def _create_styles(doc: 'Document', config: DocxConfig):
     """Create custom styles for the document"""
+    from docx.shared import Pt, Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.enum.style import WD_STYLE_TYPE
+
     styles = doc.styles
+    existing = {s.name for s in styles}
 
     # Chapter Heading style
-    if 'ChapterHeading' not in [s.name for s in styles]:
+    if 'ChapterHeading' not in existing:
         chapter_style = styles.add_style('ChapterHeading', WD_STYLE_TYPE.PARAGRAPH)
         chapter_style.font.name = config.heading_font
         chapter_style.font.size = Pt(config.chapter_font_size_pt)
@@ -368,7 +527,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         chapter_style.paragraph_format.keep_with_next = True
 
     # Section Heading style (for front/back matter)
-    if 'SectionHeading' not in [s.name for s in styles]:
+    if 'SectionHeading' not in existing:
         section_style = styles.add_style('SectionHeading', WD_STYLE_TYPE.PARAGRAPH)
         section_style.font.name = config.heading_font
         section_style.font.size = Pt(14)
@@ -380,7 +539,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         section_style.font.all_caps = True
 
     # First Paragraph style (no indent after heading)
-    if 'FirstParagraph' not in [s.name for s in styles]:
+    if 'FirstParagraph' not in existing:
         first_para_style = styles.add_style('FirstParagraph', WD_STYLE_TYPE.PARAGRAPH)
         first_para_style.font.name = config.body_font
         first_para_style.font.size = Pt(config.body_font_size_pt)
@@ -390,7 +549,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         first_para_style.paragraph_format.line_spacing = config.line_spacing
 
     # Body Text style
-    if 'BodyText' not in [s.name for s in styles]:
+    if 'BodyText' not in existing:
         body_style = styles.add_style('BodyText', WD_STYLE_TYPE.PARAGRAPH)
         body_style.font.name = config.body_font
         body_style.font.size = Pt(config.body_font_size_pt)
@@ -400,7 +559,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         body_style.paragraph_format.line_spacing = config.line_spacing
 
     # Scene Break style
-    if 'SceneBreak' not in [s.name for s in styles]:
+    if 'SceneBreak' not in existing:
         break_style = styles.add_style('SceneBreak', WD_STYLE_TYPE.PARAGRAPH)
         break_style.font.name = config.body_font
         break_style.font.size = Pt(config.body_font_size_pt)
@@ -409,7 +568,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         break_style.paragraph_format.space_after = Pt(18)
 
     # Title style
-    if 'BookTitle' not in [s.name for s in styles]:
+    if 'BookTitle' not in existing:
         title_style = styles.add_style('BookTitle', WD_STYLE_TYPE.PARAGRAPH)
         title_style.font.name = config.heading_font
         title_style.font.size = Pt(config.title_font_size_pt)
@@ -418,7 +577,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         title_style.paragraph_format.space_after = Pt(12)
 
     # Subtitle style
-    if 'BookSubtitle' not in [s.name for s in styles]:
+    if 'BookSubtitle' not in existing:
         subtitle_style = styles.add_style('BookSubtitle', WD_STYLE_TYPE.PARAGRAPH)
         subtitle_style.font.name = config.heading_font
         subtitle_style.font.size = Pt(16)
@@ -427,7 +586,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         subtitle_style.paragraph_format.space_after = Pt(24)
 
     # Author style
-    if 'BookAuthor' not in [s.name for s in styles]:
+    if 'BookAuthor' not in existing:
         author_style = styles.add_style('BookAuthor', WD_STYLE_TYPE.PARAGRAPH)
         author_style.font.name = config.heading_font
         author_style.font.size = Pt(14)
@@ -435,7 +594,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         author_style.paragraph_format.space_before = Pt(36)
 
     # Copyright style
-    if 'Copyright' not in [s.name for s in styles]:
+    if 'Copyright' not in existing:
         copyright_style = styles.add_style('Copyright', WD_STYLE_TYPE.PARAGRAPH)
         copyright_style.font.name = config.body_font
         copyright_style.font.size = Pt(10)
@@ -443,7 +602,7 @@ def _create_styles(doc: Document, config: DocxConfig):
         copyright_style.paragraph_format.space_after = Pt(12)
 
     # Dedication style
-    if 'Dedication' not in [s.name for s in styles]:
+    if 'Dedication' not in existing:
         dedication_style = styles.add_style('Dedication', WD_STYLE_TYPE.PARAGRAPH)
         dedication_style.font.name = config.body_font
         dedication_style.font.size = Pt(12)
@@ -451,11 +610,19 @@ def _create_styles(doc: Document, config: DocxConfig):
         dedication_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
 
-def _add_title_page(doc: Document, config: DocxConfig):
+def _add_vertical_space(doc: 'Document', blank_lines: int):
+    """
+    Push the next paragraph down by blank_lines empty Normal paragraphs, spliced
+    in with one parse instead of an add_paragraph() call each. Real empty lines
+    keep the gap the same height the layout has always had.
+    """
+    _append_body_xml(doc.element.body, ['<w:p/>'] * blank_lines)
+
+
+def _add_title_page(doc: 'Document', config: DocxConfig):
     """Add a title page to the document"""
     # Add some vertical space
-    for _ in range(6):
-        doc.add_paragraph()
+    _add_vertical_space(doc, 6)
 
     # Title
     doc.add_paragraph(config.title, style='BookTitle')
@@ -472,11 +639,10 @@ def _add_title_page(doc: Document, config: DocxConfig):
     doc.add_page_break()
 
 
-def _add_copyright_page(doc: Document, config: DocxConfig):
+def _add_copyright_page(doc: 'Document', config: DocxConfig):
     """Add a copyright page to the document"""
     # Add some vertical space to push content down
-    for _ in range(15):
-        doc.add_paragraph()
+    _add_vertical_space(doc, 15)
 
     # Copyright notice
     year = config.copyright_year or "2024"
@@ -497,11 +663,10 @@ def _add_copyright_page(doc: Document, config: DocxConfig):
     doc.add_page_break()
 
 
-def _add_dedication_page(doc: Document, config: DocxConfig):
+def _add_dedication_page(doc: 'Document', config: DocxConfig):
     """Add a dedication page to the document"""
     # Add vertical space
-    for _ in range(8):
-        doc.add_paragraph()
+    _add_vertical_space(doc, 8)
 
     doc.add_paragraph(config.dedication_text, style='Dedication')
 
@@ -509,7 +674,7 @@ def _add_dedication_page(doc: Document, config: DocxConfig):
     doc.add_page_break()
 
 
-def _add_about_author(doc: Document, config: DocxConfig):
+def _add_about_author(doc: 'Document', config: DocxConfig):
     """Add an About the Author section at the end"""
     doc.add_page_break()
 
@@ -518,8 +683,11 @@ def _add_about_author(doc: Document, config: DocxConfig):
     para = doc.add_paragraph(config.about_author_text, style='FirstParagraph')
 
 
-def _add_headers_footers(doc: Document, config: DocxConfig):
+def _add_headers_footers(doc: 'Document', config: DocxConfig):
     """Add headers and footers with page numbers"""
+    from docx.shared import Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
     section = doc.sections[0]
 
     # Enable different first page header/footer
@@ -545,6 +713,9 @@ def _add_headers_footers(doc: Document, config: DocxConfig):
 
 def _add_page_number(paragraph):
     """Add a page number field to a paragraph"""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
     run = paragraph.add_run()
 
     # Create the field code for page number
@@ -583,11 +754,12 @@ def generate_docx_from_manuscript(
     manuscript_path = Path(manuscript_path)
 
     if manuscript_path.suffix.lower() == '.docx':
-        # Extract text from existing DOCX
+        # Extract text from existing DOCX. manuscript_reader streams the body
+        # paragraphs out of word/document.xml (and caches them per file version),
+        # so the manuscript is not loaded into python-docx's object model here.
         try:
-            from docx import Document as DocxDocument
-            doc = DocxDocument(str(manuscript_path))
-            content = '\n\n'.join(p.text for p in doc.paragraphs)
+            from manuscript_reader import docx_paragraphs
+            content = '\n\n'.join(docx_paragraphs(manuscript_path))
         except Exception as e:
             logger.error(f"Error reading DOCX: {e}")
             raise
@@ -0,0 +1,120 @@
+"""
+Manuscript Reading Utilities
+Streams body text out of .docx files and caches what has been read per file version.
+Shared by the bookforge CLI and docx_generator, so a manuscript read by one is not
+read again by the other in the same process.
+"""
+
+import functools
+import os
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+
+@functools.lru_cache(maxsize=1)
+def _python_docx():
+    """The python-docx module, or None if it is not installed."""
+    try:
+        import docx
+    except Exception:
+        return None
+    return docx
+
+
+@dataclass
+class ManuscriptCache:
+    """What has already been extracted from one version of a manuscript file."""
+    raw_text: Optional[str] = None
+    paragraphs: Optional[List[str]] = None  # .docx body paragraphs
+    body_html: Optional[str] = None
+    wordcount: Optional[int] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _manuscript_cache_entry(path: str, mtime_ns: int, size: int) -> ManuscriptCache:
+    return ManuscriptCache()
+
+
+def manuscript_cache(path: Path) -> ManuscriptCache:
+    # Keyed on mtime and size so an edited manuscript is read afresh
+    st = os.stat(path)
+    return _manuscript_cache_entry(str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _lxml_etree():
+    """lxml.etree, or None if lxml is not installed."""
+    try:
+        from lxml import etree
+    except Exception:
+        return None
+    return etree
+
+
+def can_read_docx() -> bool:
+    return _lxml_etree() is not None or _python_docx() is not None
+
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Run children that python-docx renders as fixed text (w:t and w:br handled separately)
+_DOCX_RUN_TEXT = {
+    _W_NS + "tab": "\t",
+    _W_NS + "ptab": "\t",
+    _W_NS + "cr": "\n",
+    _W_NS + "noBreakHyphen": "-",
+}
+
+
+def _docx_run_text(run) -> str:
+    out = []
+    for e in run:
+        if e.tag == _W_NS + "t":
+            out.append(e.text or "")
+        elif e.tag == _W_NS + "br":
+            # Page and column breaks carry no text; only line breaks do
+            if e.get(_W_NS + "type", "textWrapping") == "textWrapping":
+                out.append("\n")
+        else:
+            out.append(_DOCX_RUN_TEXT.get(e.tag, ""))
+    return "".join(out)
+
+
+def docx_paragraph_texts(path: Path):
+    """Yield the text of each body paragraph, same as python-docx's Document.paragraphs.
+
+    Streams word/document.xml out of the zip with lxml.iterparse and frees each
+    paragraph once read, instead of building python-docx's full object model.
+    """
+    etree = _lxml_etree()
+    if etree is None:
+        for p in _python_docx().Document(str(path)).paragraphs:
+            yield p.text
+        return
+    body_tag = _W_NS + "body"
+    with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as xml:
+        for _, p in etree.iterparse(xml, tag=_W_NS + "p"):
+            parent = p.getparent()
+            # Paragraphs nested in tables, text boxes etc. are not body paragraphs
+            if parent is not None and parent.tag == body_tag:
+                runs = []
+                for child in p.iterchildren(_W_NS + "r", _W_NS + "hyperlink"):
+                    if child.tag == _W_NS + "hyperlink":
+                        runs.extend(_docx_run_text(r) for r in child.iterchildren(_W_NS + "r"))
+                    else:
+                        runs.append(_docx_run_text(child))
+                yield "".join(runs)
+                p.clear()
+                # Drop already-read siblings so memory stays flat on long manuscripts
+                while p.getprevious() is not None:
+                    del parent[0]
+            else:
+                p.clear()
+
+
+def docx_paragraphs(path: Path) -> List[str]:
+    cache = manuscript_cache(path)
+    if cache.paragraphs is None:
+        cache.paragraphs = list(docx_paragraph_texts(path))
+    return cache.paragraphs
@@ -7,14 +7,23 @@ A Flask-based API server for handling book formatting requests
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
 import os
+import shutil
+import stat
 import sys
 import tempfile
 import uuid
 from pathlib import Path
 import logging
 import base64
+import hashlib
+import json
+import re
 import requests
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 app = Flask(__name__)
@@ -71,29 +80,23 @@ except Exception as e:
 # Gemini AI for manuscript analysis
 GEMINI_AVAILABLE = False
 GEMINI_CLIENT = None
+# Environment variable names the Gemini key may be set under, in order of preference
+GEMINI_KEY_VARS = ('GEMINI_API_KEY', 'GOOGLE_AI_API_KEY', 'GOOGLEAI_API_KEY', 'GOOGLE_GEMINI_API_KEY')
 try:
     import google.generativeai as genai
     # Try multiple possible environment variable names
-    gemini_key = (
-        os.environ.get('GEMINI_API_KEY') or 
-        os.environ.get('GOOGLE_AI_API_KEY') or 
-        os.environ.get('GOOGLEAI_API_KEY') or
-        os.environ.get('GOOGLE_GEMINI_API_KEY')
-    )
+    gemini_key = None
+    for gemini_key_var in GEMINI_KEY_VARS:
+        gemini_key = os.environ.get(gemini_key_var)
+        if gemini_key:
+            break
     
     if gemini_key:
         # Clean the key (remove whitespace)
         gemini_key = gemini_key.strip()
         
         # Log which variable was found (without exposing the key)
-        if os.environ.get('GEMINI_API_KEY'):
-            logger.info("Found GEMINI_API_KEY environment variable")
-        elif os.environ.get('GOOGLE_AI_API_KEY'):
-            logger.info("Found GOOGLE_AI_API_KEY environment variable")
-        elif os.environ.get('GOOGLEAI_API_KEY'):
-            logger.info("Found GOOGLEAI_API_KEY environment variable")
-        elif os.environ.get('GOOGLE_GEMINI_API_KEY'):
-            logger.info("Found GOOGLE_GEMINI_API_KEY environment variable")
+        logger.info(f"Found {gemini_key_var} environment variable")
         
         # Validate key format (should start with AIza)
         if not gemini_key.startswith('AIza'):
@@ -114,11 +117,11 @@ try:
                 raise
         GEMINI_AVAILABLE = True
     else:
-        logger.warning("No Gemini API key found. Checked: GEMINI_API_KEY, GOOGLE_AI_API_KEY, GOOGLEAI_API_KEY, GOOGLE_GEMINI_API_KEY")
-        # Log all environment variables that might be related (for debugging)
-        gemini_vars = {k: v[:10] + '...' if len(v) > 10 else v for k, v in os.environ.items() if 'GEMINI' in k.upper() or 'GOOGLE' in k.upper() and 'API' in k.upper()}
+        logger.warning(f"No Gemini API key found. Checked: {', '.join(GEMINI_KEY_VARS)}")
+        # Log the names of environment variables that might be related (for debugging)
+        gemini_vars = [k for k in os.environ if 'GEMINI' in k.upper() or ('GOOGLE' in k.upper() and 'API' in k.upper())]
         if gemini_vars:
-            logger.info(f"Found related environment variables: {list(gemini_vars.keys())}")
+            logger.info(f"Found related environment variables: {gemini_vars}")
 except ImportError:
     logger.warning("google-generativeai not available. AI features will be disabled.")
 except Exception as e:
@@ -147,7 +150,6 @@ try:
         STORAGE_CLIENT = storage.bucket()
         logger.info("Firebase Storage configured successfully")
     elif firebase_config:
-        import json
         cred = credentials.Certificate(json.loads(firebase_config))
         firebase_admin.initialize_app(cred, {
             'storageBucket': os.environ.get('FIREBASE_STORAGE_BUCKET', 'bookforge.appspot.com')
@@ -173,22 +175,105 @@ except ImportError:
 # Store for active projects
 projects = {}
 
+# Firebase uploads go up in chunks of this size (must be a multiple of 256KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Shared pool for work a request starts but does not wait on (Firebase uploads,
+# background AI analysis), so load cannot spawn an unbounded number of threads
+_IO_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Upload-time AI analyses keyed on a digest of the manuscript excerpt sent to Gemini,
+# so re-uploading the same manuscript (common while iterating on it) reuses the result
+_ANALYSIS_CACHE_SIZE = 256
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# Patterns for pulling JSON out of Gemini responses and flattening extracted HTML
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_JSON_FENCE_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _get_cached_analysis(key):
+    with _analysis_cache_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is not None:
+            _analysis_cache.move_to_end(key)
+        return analysis
+
+
+def _cache_analysis(key, analysis):
+    with _analysis_cache_lock:
+        _analysis_cache[key] = analysis
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+
+# Guards a project's manuscript_path against the background uploads that read it
+_manuscript_lock = threading.Lock()
+
+
+def _retire_manuscript(path):
+    """Delete a superseded upload's version directory (/tmp/bookforge/<project>/<version>/)"""
+    path = Path(path)
+    if path.parent.parent.parent == Path(tempfile.gettempdir()) / 'bookforge':
+        shutil.rmtree(path.parent, ignore_errors=True)
+
+
+def _upload_manuscript_to_firebase(project_id, file_path, filename, content_type, attempts=3):
+    """Upload a saved manuscript to Firebase Storage, retrying with backoff, and record its URL"""
+    file_url = None
+    for attempt in range(attempts):
+        try:
+            # Stream from the saved copy; a chunk size makes large files go up as a
+            # resumable upload in 8MB pieces instead of one in-memory request
+            blob = STORAGE_CLIENT.blob(f"manuscripts/{project_id}/{filename}", chunk_size=UPLOAD_CHUNK_SIZE)
+            blob.upload_from_filename(str(file_path), content_type=content_type)
+            blob.make_public()
+            file_url = blob.public_url
+            logger.info(f"Uploaded to Firebase: {file_url}")
+            break
+        except Exception as e:
+            if attempt + 1 < attempts:
+                logger.warning(f"Firebase upload attempt {attempt + 1} failed, retrying: {e}")
+                time.sleep(2 ** attempt)
+            else:
+                # Firebase upload failure is non-critical - file is saved locally
+                logger.warning(f"Firebase upload failed (using local storage): {e}")
+
+    # The project may have been deleted or given another manuscript in the meantime
+    with _manuscript_lock:
+        project = projects.get(project_id)
+        current = project is not None and project.get('manuscript_path') == str(file_path)
+        if current:
+            project['manuscript_url'] = file_url
+            project['manuscript_upload_status'] = 'uploaded' if file_url else 'failed'
+    if not current:
+        _retire_manuscript(file_path)
+
+# Everything the health check reports is settled at import, so its body is
+# serialized once (compact, as jsonify renders it outside debug mode)
+_HEALTH_BODY = app.json.dumps({
+    'status': 'healthy',
+    'service': 'BookForge API',
+    'version': '1.0.0',
+    'gemini_available': GEMINI_AVAILABLE,
+    'firebase_available': FIREBASE_AVAILABLE,
+    'openai_available': OPENAI_AVAILABLE,
+    'weasyprint_available': WEASYPRINT_AVAILABLE,
+    'weasyprint_version': WEASYPRINT_VERSION,
+    'pydyf_version': PYDYF_VERSION,
+    'python_version': sys.version
+}, separators=(',', ':')) + '\n'
+
 @app.route('/api/health', methods=['GET'])
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'BookForge API',
-        'version': '1.0.0',
-        'gemini_available': GEMINI_AVAILABLE,
-        'firebase_available': FIREBASE_AVAILABLE,
-        'openai_available': OPENAI_AVAILABLE,
-        'weasyprint_available': WEASYPRINT_AVAILABLE,
-        'weasyprint_version': WEASYPRINT_VERSION,
-        'pydyf_version': PYDYF_VERSION,
-        'python_version': sys.version
-    })
+    return app.response_class(_HEALTH_BODY, mimetype=app.json.mimetype)
 
 @app.route('/api/projects', methods=['POST'])
 def create_project():
@@ -257,41 +342,38 @@ def debug_project(project_id):
     
     # Check manuscript file
     if project.get('manuscript_path'):
-        manuscript_path = Path(project['manuscript_path'])
-        debug_info['file_checks']['manuscript_path'] = {
-            'path': str(manuscript_path),
-            'exists': manuscript_path.exists(),
-            'is_file': manuscript_path.is_file() if manuscript_path.exists() else False,
-            'size': manuscript_path.stat().st_size if manuscript_path.exists() else 0
-        }
+        debug_info['file_checks']['manuscript_path'] = _file_check(project['manuscript_path'])
     
     # Check output files
     if project.get('output_paths'):
-        debug_info['file_checks']['output_paths'] = {}
-        for format_type, path in project['output_paths'].items():
-            output_path = Path(path)
-            debug_info['file_checks']['output_paths'][format_type] = {
-                'path': str(output_path),
-                'exists': output_path.exists(),
-                'is_file': output_path.is_file() if output_path.exists() else False,
-                'size': output_path.stat().st_size if output_path.exists() else 0
-            }
+        debug_info['file_checks']['output_paths'] = {
+            format_type: _file_check(path)
+            for format_type, path in project['output_paths'].items()
+        }
     
-    # Check project directory
+    # Check project directory; listing it answers exists/is_dir in the same call
     temp_dir = Path(tempfile.gettempdir()) / 'bookforge' / project_id
-    debug_info['directory_checks']['project_dir'] = {
-        'path': str(temp_dir),
-        'exists': temp_dir.exists(),
-        'is_dir': temp_dir.is_dir() if temp_dir.exists() else False
-    }
-    
-    if temp_dir.exists():
-        debug_info['directory_checks']['project_dir']['contents'] = [
-            str(p.name) for p in temp_dir.iterdir()
-        ]
+    dir_check = {'path': str(temp_dir), 'exists': False, 'is_dir': False}
+    try:
+        with os.scandir(temp_dir) as entries:
+            dir_check['contents'] = [entry.name for entry in entries]
+        dir_check['exists'] = dir_check['is_dir'] = True
+    except NotADirectoryError:
+        dir_check['exists'] = True
+    except FileNotFoundError:
+        pass
+    debug_info['directory_checks']['project_dir'] = dir_check
     
     return jsonify(debug_info)
 
+def _file_check(path):
+    """exists/is_file/size of a path for debug_project, from a single stat() call"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {'path': str(path), 'exists': False, 'is_file': False, 'size': 0}
+    return {'path': str(path), 'exists': True, 'is_file': stat.S_ISREG(st.st_mode), 'size': st.st_size}
+
 @app.route('/api/projects/<project_id>/upload', methods=['POST'])
 def upload_manuscript(project_id):
     """Upload manuscript file for a project"""
@@ -316,55 +398,45 @@ def upload_manuscript(project_id):
             logger.error(f"[UPLOAD] Empty filename")
             return jsonify({'error': 'No file selected'}), 400
         
+        # Save the upload once; text extraction and the Firebase upload both read this copy.
+        # Each upload gets its own directory so a later upload of the same file name
+        # cannot overwrite bytes a background Firebase upload is still reading.
+        upload_dir = Path(tempfile.gettempdir()) / 'bookforge' / project_id / uuid.uuid4().hex
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        file_path = upload_dir / file.filename
+        file.save(file_path)
+        
         # Try to extract content from the file
         content = None
         if DOCUMENT_PROCESSOR_AVAILABLE:
             try:
-                # Save temporarily to extract content
-                temp_dir = Path(tempfile.gettempdir()) / 'bookforge_temp'
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                temp_path = temp_dir / f"temp_{file.filename}"
-                file.save(temp_path)
-                
                 # Extract text content
-                content = extract_text_from_file(temp_path)
+                content = extract_text_from_file(file_path)
                 logger.info(f"Extracted content from {file.filename}: {len(content) if content else 0} characters")
-                
-                # Delete temp file
-                temp_path.unlink()
-                
-                # Reset file pointer for upload
-                file.seek(0)
             except Exception as e:
                 logger.error(f"Error extracting content: {e}")
         
-        # Upload to Firebase Storage if available and bucket is configured
-        file_url = None
+        # Upload to Firebase Storage if available and bucket is configured. This runs in
+        # the background: builds use the local copy, and manuscript_url is set once it is up
         storage_bucket = os.environ.get('FIREBASE_STORAGE_BUCKET')
-        if FIREBASE_AVAILABLE and STORAGE_CLIENT and storage_bucket:
-            try:
-                blob = STORAGE_CLIENT.blob(f"manuscripts/{project_id}/{file.filename}")
-                blob.upload_from_file(file, content_type=file.content_type)
-                blob.make_public()
-                file_url = blob.public_url
-                logger.info(f"Uploaded to Firebase: {file_url}")
-            except Exception as e:
-                # Firebase upload failure is non-critical - file is saved locally
-                logger.warning(f"Firebase upload failed (using local storage): {e}")
-        elif FIREBASE_AVAILABLE and not storage_bucket:
+        upload_to_firebase = bool(FIREBASE_AVAILABLE and STORAGE_CLIENT and storage_bucket)
+        if FIREBASE_AVAILABLE and not storage_bucket:
             logger.warning("Firebase Storage bucket not configured (FIREBASE_STORAGE_BUCKET env var not set). Using local storage only.")
         
-        # Also save locally as backup
-        upload_dir = Path(tempfile.gettempdir()) / 'bookforge' / project_id
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / file.filename
-        file.seek(0)
-        file.save(file_path)
-        
         # Update project
-        projects[project_id]['manuscript_path'] = str(file_path)
-        projects[project_id]['manuscript_url'] = file_url
-        projects[project_id]['status'] = 'uploaded'
+        with _manuscript_lock:
+            previous_path = projects[project_id].get('manuscript_path')
+            # A pending upload of the previous copy removes it once it finishes
+            previous_pending = projects[project_id].get('manuscript_upload_status') == 'pending'
+            projects[project_id]['manuscript_path'] = str(file_path)
+            projects[project_id]['manuscript_url'] = None
+            projects[project_id]['manuscript_upload_status'] = 'pending' if upload_to_firebase else None
+            projects[project_id]['status'] = 'uploaded'
+        if previous_path and not previous_pending:
+            _retire_manuscript(previous_path)
+        if upload_to_firebase:
+            _IO_POOL.submit(_upload_manuscript_to_firebase, project_id, file_path, file.filename, file.content_type)
+        
         if content:
             projects[project_id]['manuscript_content'] = content
             logger.info(f"[UPLOAD] Extracted {len(content)} characters of content")
@@ -374,11 +446,17 @@ def upload_manuscript(project_id):
             if GEMINI_AVAILABLE and GEMINI_CLIENT:
                 try:
                     # Run analysis in background (don't block response)
-                    import threading
                     def analyze_background():
+                        global GEMINI_CLIENT
                         try:
                             # Use the analyze endpoint logic
                             content_sample = content[:10000] if len(content) > 10000 else content
+                            cache_key = hashlib.sha256(content_sample.encode('utf-8')).hexdigest()
+                            cached = _get_cached_analysis(cache_key)
+                            if cached is not None:
+                                projects[project_id]['ai_analysis'] = cached
+                                logger.info(f"[UPLOAD] Reused AI analysis of identical manuscript for {project_id}")
+                                return
                             prompt = f"""You are a professional book editor. Analyze this manuscript excerpt and provide:
 
 1. Title suggestions (3-5 options)
@@ -416,17 +494,16 @@ Return JSON:
                                     raise
                             
                             analysis_text = response.text
-                            import json
-                            import re
-                            json_match = re.search(r'\{.*\}', analysis_text, re.DOTALL)
+                            json_match = _JSON_BLOCK_RE.search(analysis_text)
                             if json_match:
                                 analysis = json.loads(json_match.group())
+                                _cache_analysis(cache_key, analysis)
                                 projects[project_id]['ai_analysis'] = analysis
                                 logger.info(f"[UPLOAD] Background AI analysis completed for {project_id}")
                         except Exception as e:
                             logger.warning(f"[UPLOAD] Background analysis failed: {e}")
                     
-                    threading.Thread(target=analyze_background, daemon=True).start()
+                    _IO_POOL.submit(analyze_background)
                 except Exception as e:
                     logger.warning(f"[UPLOAD] Failed to start background analysis: {e}")
         
@@ -438,7 +515,10 @@ Return JSON:
             'message': 'File uploaded successfully',
             'filename': file.filename,
             'size': file_path.stat().st_size,
-            'url': file_url,
+            # The Firebase upload finishes after this response, so url is normally None here;
+            # upload_status is 'pending' until GET /api/projects/<id> shows the manuscript_url
+            'url': projects[project_id]['manuscript_url'],
+            'upload_status': projects[project_id]['manuscript_upload_status'],
             'content_length': len(content) if content else 0,
             'content': content  # Include extracted content in response
         })
@@ -515,6 +595,110 @@ def extract_text():
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': f'Failed to extract text: {str(e)}'}), 500
 
+# Cover prompt building blocks for generate_cover
+
+# Comprehensive style guidance with more detail
+COVER_STYLE_GUIDES = {
+    'modern': {
+        'base': 'modern minimalist book cover design',
+        'details': 'clean typography, ample white space, geometric shapes, contemporary aesthetic',
+        'colors': 'bold contrasting colors or monochromatic palette'
+    },
+    'classic': {
+        'base': 'classic elegant book cover design',
+        'details': 'traditional typography, ornate borders or frames, timeless aesthetic',
+        'colors': 'rich deep colors, gold accents, vintage color palette'
+    },
+    'fantasy': {
+        'base': 'epic fantasy book cover artwork',
+        'details': 'dramatic lighting, mythical creatures or magical elements, epic landscapes, detailed illustration',
+        'colors': 'vibrant colors with deep shadows, mystical lighting effects'
+    },
+    'mystery': {
+        'base': 'dark atmospheric mystery book cover',
+        'details': 'moody shadows, mysterious silhouettes, noir aesthetic, intriguing details',
+        'colors': 'dark color palette with dramatic contrast, noir black and white with accent colors'
+    },
+    'romance': {
+        'base': 'romantic elegant book cover design',
+        'details': 'soft flowing elements, elegant typography, warm intimate atmosphere',
+        'colors': 'warm romantic colors, pastels, soft gradients, rose and cream tones'
+    },
+    'sci-fi': {
+        'base': 'futuristic sci-fi book cover design',
+        'details': 'high-tech elements, space themes, futuristic architecture, sleek design',
+        'colors': 'cool high-tech colors, neon accents, metallic surfaces, space blues and purples'
+    },
+    'non-fiction': {
+        'base': 'professional informative book cover',
+        'details': 'clear hierarchy, readable typography, professional layout, informative imagery',
+        'colors': 'professional color scheme, clean and organized, business-appropriate'
+    },
+    'thriller': {
+        'base': 'high-tension thriller book cover',
+        'details': 'dynamic composition, action elements, intense atmosphere, gripping imagery',
+        'colors': 'high contrast, bold colors, dramatic shadows, tension-building palette'
+    },
+    'historical': {
+        'base': 'vintage historical book cover design',
+        'details': 'period-appropriate aesthetic, antique elements, classic typography, timeless design',
+        'colors': 'vintage color palette, sepia tones, aged paper aesthetic, historical colors'
+    },
+    'horror': {
+        'base': 'chilling horror book cover',
+        'details': 'dark atmosphere, unsettling imagery, gothic elements, haunting aesthetic',
+        'colors': 'dark menacing colors, blood red accents, deep shadows, eerie lighting'
+    },
+    'business': {
+        'base': 'professional business book cover',
+        'details': 'corporate design, clean modern layout, professional imagery, authoritative',
+        'colors': 'corporate blues and grays, professional color scheme, business-appropriate'
+    },
+    'self-help': {
+        'base': 'inspiring self-help book cover',
+        'details': 'uplifting imagery, positive energy, motivational elements, approachable design',
+        'colors': 'bright inspiring colors, optimistic palette, energetic tones'
+    }
+}
+
+# Color palette overrides ('auto' and unknown values use the cover style's colors)
+COVER_COLOR_PALETTES = {
+    'warm': 'warm color palette with oranges, reds, and yellows',
+    'cool': 'cool color palette with blues, greens, and purples',
+    'monochrome': 'monochromatic color scheme in black, white, and grays',
+    'bold': 'vibrant bold colors with high saturation and contrast',
+    'pastel': 'soft pastel color palette with gentle tones',
+    'dark': 'dark moody color palette with deep shadows',
+    'bright': 'bright cheerful color palette with high energy'
+}
+
+# Visual style modifiers
+COVER_VISUAL_STYLES = {
+    'illustrated': 'hand-drawn or digital illustration style, artistic rendering',
+    'photographic': 'high-quality photography with professional lighting and composition',
+    'mixed': 'combination of photography and illustration elements, photorealistic mixed media',
+    'graphic': 'graphic design elements, abstract shapes, typography-focused',
+    'painterly': 'painterly artistic style, brushstroke textures, artistic interpretation'
+}
+
+# Mood modifiers
+COVER_MOOD_DESCRIPTORS = {
+    'energetic': 'dynamic energetic atmosphere with movement and action',
+    'calm': 'peaceful serene atmosphere with tranquil elements',
+    'dramatic': 'dramatic intense atmosphere with strong emotional impact',
+    'mysterious': 'mysterious enigmatic atmosphere with intrigue and suspense',
+    'warm': 'warm inviting atmosphere with friendly welcoming feeling',
+    'neutral': ''  # No mood modifier
+}
+
+# Trim sizes covers are proportioned for
+COVER_TRIM_DIMENSIONS = {
+    '5x8': {'width': 5, 'height': 8},
+    '5.5x8.5': {'width': 5.5, 'height': 8.5},
+    '6x9': {'width': 6, 'height': 9},
+    '8.5x11': {'width': 8.5, 'height': 11}
+}
+
 @app.route('/api/projects/<project_id>/generate-cover', methods=['POST'])
 def generate_cover(project_id):
     """Generate a book cover using OpenAI DALL-E"""
@@ -634,102 +818,7 @@ Return ONLY the description, no commentary."""
         # Build the prompt for DALL-E with enhanced structure
         prompt_parts = []
         
-        # Comprehensive style guidance with more detail
-        style_guides = {
-            'modern': {
-                'base': 'modern minimalist book cover design',
-                'details': 'clean typography, ample white space, geometric shapes, contemporary aesthetic',
-                'colors': 'bold contrasting colors or monochromatic palette'
-            },
-            'classic': {
-                'base': 'classic elegant book cover design',
-                'details': 'traditional typography, ornate borders or frames, timeless aesthetic',
-                'colors': 'rich deep colors, gold accents, vintage color palette'
-            },
-            'fantasy': {
-                'base': 'epic fantasy book cover artwork',
-                'details': 'dramatic lighting, mythical creatures or magical elements, epic landscapes, detailed illustration',
-                'colors': 'vibrant colors with deep shadows, mystical lighting effects'
-            },
-            'mystery': {
-                'base': 'dark atmospheric mystery book cover',
-                'details': 'moody shadows, mysterious silhouettes, noir aesthetic, intriguing details',
-                'colors': 'dark color palette with dramatic contrast, noir black and white with accent colors'
-            },
-            'romance': {
-                'base': 'romantic elegant book cover design',
-                'details': 'soft flowing elements, elegant typography, warm intimate atmosphere',
-                'colors': 'warm romantic colors, pastels, soft gradients, rose and cream tones'
-            },
-            'sci-fi': {
-                'base': 'futuristic sci-fi book cover design',
-                'details': 'high-tech elements, space themes, futuristic architecture, sleek design',
-                'colors': 'cool high-tech colors, neon accents, metallic surfaces, space blues and purples'
-            },
-            'non-fiction': {
-                'base': 'professional informative book cover',
-                'details': 'clear hierarchy, readable typography, professional layout, informative imagery',
-                'colors': 'professional color scheme, clean and organized, business-appropriate'
-            },
-            'thriller': {
-                'base': 'high-tension thriller book cover',
-                'details': 'dynamic composition, action elements, intense atmosphere, gripping imagery',
-                'colors': 'high contrast, bold colors, dramatic shadows, tension-building palette'
-            },
-            'historical': {
-                'base': 'vintage historical book cover design',
-                'details': 'period-appropriate aesthetic, antique elements, classic typography, timeless design',
-                'colors': 'vintage color palette, sepia tones, aged paper aesthetic, historical colors'
-            },
-            'horror': {
-                'base': 'chilling horror book cover',
-                'details': 'dark atmosphere, unsettling imagery, gothic elements, haunting aesthetic',
-                'colors': 'dark menacing colors, blood red accents, deep shadows, eerie lighting'
-            },
-            'business': {
-                'base': 'professional business book cover',
-                'details': 'corporate design, clean modern layout, professional imagery, authoritative',
-                'colors': 'corporate blues and grays, professional color scheme, business-appropriate'
-            },
-            'self-help': {
-                'base': 'inspiring self-help book cover',
-                'details': 'uplifting imagery, positive energy, motivational elements, approachable design',
-                'colors': 'bright inspiring colors, optimistic palette, energetic tones'
-            }
-        }
-        
-        style_info = style_guides.get(cover_style, style_guides['modern'])
-        
-        # Color palette overrides
-        color_palettes = {
-            'warm': 'warm color palette with oranges, reds, and yellows',
-            'cool': 'cool color palette with blues, greens, and purples',
-            'monochrome': 'monochromatic color scheme in black, white, and grays',
-            'bold': 'vibrant bold colors with high saturation and contrast',
-            'pastel': 'soft pastel color palette with gentle tones',
-            'dark': 'dark moody color palette with deep shadows',
-            'bright': 'bright cheerful color palette with high energy',
-            'auto': style_info['colors']  # Use style default
-        }
-        
-        # Visual style modifiers
-        visual_styles = {
-            'illustrated': 'hand-drawn or digital illustration style, artistic rendering',
-            'photographic': 'high-quality photography with professional lighting and composition',
-            'mixed': 'combination of photography and illustration elements, photorealistic mixed media',
-            'graphic': 'graphic design elements, abstract shapes, typography-focused',
-            'painterly': 'painterly artistic style, brushstroke textures, artistic interpretation'
-        }
-        
-        # Mood modifiers
-        mood_descriptors = {
-            'energetic': 'dynamic energetic atmosphere with movement and action',
-            'calm': 'peaceful serene atmosphere with tranquil elements',
-            'dramatic': 'dramatic intense atmosphere with strong emotional impact',
-            'mysterious': 'mysterious enigmatic atmosphere with intrigue and suspense',
-            'warm': 'warm inviting atmosphere with friendly welcoming feeling',
-            'neutral': ''  # No mood modifier
-        }
+        style_info = COVER_STYLE_GUIDES.get(cover_style, COVER_STYLE_GUIDES['modern'])
         
         # Build comprehensive prompt
         prompt = f"Professional book cover design for the book '{title}'"
@@ -742,15 +831,15 @@ Return ONLY the description, no commentary."""
         prompt += f". {style_info['base']}, {style_info['details']}"
         
         # Add visual style
-        prompt += f". Style: {visual_styles.get(visual_style, visual_styles['illustrated'])}"
+        prompt += f". Style: {COVER_VISUAL_STYLES.get(visual_style, COVER_VISUAL_STYLES['illustrated'])}"
         
         # Add color palette
-        color_desc = color_palettes.get(color_palette, color_palettes['auto'])
+        color_desc = COVER_COLOR_PALETTES.get(color_palette, style_info['colors'])
         prompt += f". Color scheme: {color_desc}"
         
         # Add mood if specified
         if mood != 'neutral':
-            prompt += f". Mood: {mood_descriptors.get(mood, '')}"
+            prompt += f". Mood: {COVER_MOOD_DESCRIPTORS.get(mood, '')}"
         
         # Add custom description
         if cover_description:
@@ -773,15 +862,9 @@ Return ONLY the description, no commentary."""
         
         # Get trim size for aspect ratio
         trim = project.get('config', {}).get('trim', '6x9')
-        trim_dimensions = {
-            '5x8': {'width': 5, 'height': 8},
-            '5.5x8.5': {'width': 5.5, 'height': 8.5},
-            '6x9': {'width': 6, 'height': 9},
-            '8.5x11': {'width': 8.5, 'height': 11}
-        }
         
         # Calculate aspect ratio for book cover (front cover only, not full spread)
-        trim_info = trim_dimensions.get(trim, trim_dimensions['6x9'])
+        trim_info = COVER_TRIM_DIMENSIONS.get(trim, COVER_TRIM_DIMENSIONS['6x9'])
         aspect_ratio = trim_info['width'] / trim_info['height']
         
         # DALL-E 3 supports: 1024x1024 (1:1), 1024x1792 (portrait), 1792x1024 (landscape)
@@ -960,11 +1043,10 @@ def analyze_manuscript(project_id):
             return jsonify({'error': 'No manuscript content available'}), 400
         
         # Strip HTML tags if content is HTML (from DOCX extraction)
-        import re
         if content.strip().startswith('<') and '</' in content:
             # Remove HTML tags but keep text content
-            content = re.sub(r'<[^>]+>', ' ', content)
-            content = re.sub(r'\s+', ' ', content).strip()
+            content = _HTML_TAG_RE.sub(' ', content)
+            content = _WHITESPACE_RE.sub(' ', content).strip()
             logger.info("Stripped HTML tags from content for analysis")
         
         # Enhanced prompt for professional manuscript analysis
@@ -1040,9 +1122,6 @@ Be specific, constructive, and professional in your feedback. Focus on actionabl
         logger.info(f"Analyzing manuscript for project {project_id}")
         logger.info(f"Content length: {len(content)} characters, sample length: {len(content_sample)} characters")
         
-        import json
-        import re
-        
         analysis_text = None
         try:
             response = GEMINI_CLIENT.generate_content(prompt)
@@ -1167,7 +1246,7 @@ Be specific, constructive, and professional in your feedback. Focus on actionabl
         analysis = None
         try:
             # Look for JSON in the response (improved pattern)
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', analysis_text, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(analysis_text)
             if json_match:
                 try:
                     analysis = json.loads(json_match.group())
@@ -1175,7 +1254,7 @@ Be specific, constructive, and professional in your feedback. Focus on actionabl
                 except json.JSONDecodeError as json_err:
                     logger.warning(f"JSON decode error: {json_err}, trying alternative extraction")
                     # Try alternative JSON extraction
-                    json_match = re.search(r'```json\s*(\{.*?\})\s*```', analysis_text, re.DOTALL)
+                    json_match = _JSON_FENCE_RE.search(analysis_text)
                     if json_match:
                         analysis = json.loads(json_match.group(1))
         except Exception as parse_error:
@@ -1336,7 +1415,9 @@ def build_book(project_id):
                 'ackText': 'ack_text',
                 'includeAboutAuthor': 'include_about_author',
                 'aboutAuthorText': 'about_author_text',
-                'sceneBreak': 'scene_break'
+                'sceneBreak': 'scene_break',
+                'pdfOptimize': 'pdf_optimize',
+                'fastPreview': 'fast_preview'
             }
             return key_map.get(key, key)
         
@@ -1463,6 +1544,8 @@ def preview_book(project_id):
                 'aboutAuthorText': 'about_author_text',
                 'sceneBreak': 'scene_break',
                 'targetPlatform': 'target_platform',
+                'pdfOptimize': 'pdf_optimize',
+                'fastPreview': 'fast_preview',
                 'imprint': 'imprint',
                 'isbn': 'isbn'
             }
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The API modules import each other as top-level siblings (see server.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
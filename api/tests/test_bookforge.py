@@ -0,0 +1,22 @@
+import re
+
+from bookforge import BuildConfig, postprocess_body_html
+
+
+def _ids(html):
+    return re.findall(r'\bid="([^"]*)"', html)
+
+
+def test_generated_heading_ids_avoid_existing_ids():
+    body = (
+        '<section id="chapter-1" class="level1"><p>Intro</p></section>'
+        '<h1>Chapter 1</h1><p>Text</p>'
+        '<h2>Scene</h2><p>One</p>'
+        '<h2>Scene</h2><p>Two</p>'
+        "<a id='scene-2'></a>"
+    )
+    html = postprocess_body_html(body, BuildConfig(title="Book"))
+
+    ids = _ids(html) + re.findall(r"\bid='([^']*)'", html)
+    assert len(ids) == len(set(ids))
+    assert _ids(html)[1:] == ["chapter-1-2", "scene", "scene-3"]
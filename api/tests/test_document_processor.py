@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("bs4")
+
+from document_processor import extract_text_from_file
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p>a</p></html>\n<p>after</p>", "a\nafter"),
+    ("</div>Lead text<p>x</p>", "Lead text\nx"),
+    ("</body>Hello", "Hello"),
+    ("<p>one</p><script>var x = 1;</script><style>p {}</style><p>two</p>", "one\ntwo"),
+])
+def test_html_text_keeps_content_around_stray_tags(tmp_path, html, expected):
+    path = tmp_path / "page.html"
+    path.write_text(html, encoding="utf-8")
+    assert extract_text_from_file(path) == expected
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("docx")
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from docx_generator import generate_docx_from_manuscript
+
+
+def _blank_lines_before(paragraphs, text):
+    """Empty, unformatted paragraphs directly above the first paragraph with this text."""
+    index = next(i for i, p in enumerate(paragraphs) if p.text == text)
+    count = 0
+    for p in reversed(paragraphs[:index]):
+        # The page break that ends the previous page is a run without text
+        if p.text or p._p.find(qn("w:r")) is not None:
+            break
+        assert p._p.find(qn("w:pPr")) is None
+        count += 1
+    return count
+
+
+@pytest.mark.parametrize("font_size_pt, line_height", [(11.0, 1.35), (14.0, 2.0)])
+def test_front_matter_spacing_is_blank_normal_lines(tmp_path, font_size_pt, line_height):
+    manuscript = tmp_path / "book.txt"
+    manuscript.write_text("Chapter 1\n\nIt was a dark night.\n", encoding="utf-8")
+    output = generate_docx_from_manuscript(manuscript, tmp_path / "book.docx", {
+        "title": "The Title",
+        "author": "An Author",
+        "include_dedication": True,
+        "dedication_text": "For you.",
+        "font_size_pt": font_size_pt,
+        "line_height": line_height,
+    })
+
+    paragraphs = Document(str(output)).paragraphs
+    # Same gaps as the layout has always used: plain Normal lines, whose height
+    # does not depend on the body font size or line height
+    assert _blank_lines_before(paragraphs, "The Title") == 6
+    assert _blank_lines_before(paragraphs, "Copyright © 2024 An Author") == 15
+    assert _blank_lines_before(paragraphs, "For you.") == 8